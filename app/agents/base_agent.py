@@ -3,11 +3,95 @@
 모든 전문 에이전트들이 상속받는 추상 베이스 클래스
 """
 import os
+import io
+import re
+import time
+import random
 import asyncio
+import orjson
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
-from openai import OpenAI
+from typing import Dict, Any, List, Optional
+from openai import AsyncOpenAI, APIStatusError, RateLimitError
 from app.utils.logger import LoggerMixin
+from app.utils.llm_cache import get_llm_cache
+
+# 프로세스 전역 OpenAI 클라이언트 캐시 (api_key별 1개)
+# 에이전트마다 클라이언트를 새로 만들면 커넥션 풀/TLS 핸드셰이크가 중복됨
+_client_cache: Dict[str, AsyncOpenAI] = {}
+
+
+def _get_openai_client(api_key: str) -> AsyncOpenAI:
+    """api_key별 공유 AsyncOpenAI 클라이언트 반환"""
+    client = _client_cache.get(api_key)
+    if client is None:
+        client = AsyncOpenAI(api_key=api_key)
+        _client_cache[api_key] = client
+    return client
+
+
+# 코드펜스(```json ... ```)로 감싼 응답에서 내부 JSON만 추출하기 위한 정규식
+# 펜스 제거는 파서별이 아니라 _call_ai_api에서 한 번만 수행해 모든 에이전트에
+# 동일한 본문이 전달되도록 한다
+_JSON_FENCE_RE = re.compile(r'```(?:json)?\s*(\{.*\})\s*```', re.S)
+
+
+def _strip_json_fence(response_text: str) -> str:
+    """코드펜스로 감싼 응답이면 내부 JSON 본문만 반환"""
+    fence_match = _JSON_FENCE_RE.search(response_text)
+    if fence_match:
+        return fence_match.group(1)
+    return response_text
+
+
+def _is_json_text(text: str) -> bool:
+    """본문이 정상 JSON 파싱 경로를 탈 수 있는지 검사
+
+    모든 에이전트의 parse_response는 JSON 파싱 실패 시 저품질 폴백 결과를
+    반환하므로, JSON이 아닌 응답은 캐시 대상에서 제외한다.
+    """
+    try:
+        orjson.loads(text)
+        return True
+    except orjson.JSONDecodeError:
+        return False
+
+
+class _TokenBucket:
+    """
+    분당 요청 수(RPM)를 고르게 분산시키는 토큰 버킷
+
+    여러 에이전트가 동시에 실행될 때 API 할당량을 순간적으로 초과해
+    429 백오프로 전체 파이프라인이 멈추는 것을 방지
+    """
+
+    def __init__(self, rate_per_minute: int):
+        self.capacity = float(rate_per_minute)
+        self.tokens = float(rate_per_minute)
+        self.fill_rate = rate_per_minute / 60.0
+        self.updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """토큰 1개를 확보할 때까지 대기"""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.fill_rate)
+                self.updated_at = now
+
+                if self.tokens >= 1.0:
+                    self.tokens -= 1.0
+                    return
+
+                await asyncio.sleep((1.0 - self.tokens) / self.fill_rate)
+
+
+# API 호출 페이싱 - 동시 호출 수 제한 + RPM 기반 토큰 버킷
+_api_semaphore = asyncio.Semaphore(int(os.getenv("OPENAI_MAX_CONCURRENCY", "20")))
+_api_rate_limiter = _TokenBucket(int(os.getenv("OPENAI_RPM", "60")))
+
+# 재시도 백오프 상한 (초)
+_MAX_BACKOFF = 30.0
 
 
 class BaseAgent(LoggerMixin, ABC):
@@ -37,7 +121,10 @@ class BaseAgent(LoggerMixin, ABC):
             self.log_error("❌ OPENAI_API_KEY 환경 변수 누락")
             raise ValueError("OPENAI_API_KEY 환경 변수가 설정되지 않았습니다.")
 
-        self.openai_client = OpenAI(api_key=api_key)
+        # 비동기 클라이언트 사용 - LLM 호출 중 이벤트 루프 블로킹 방지
+        # (동기 클라이언트는 호출당 수십 초씩 루프를 점유해 다른 요청 처리를 막음)
+        # 커넥션 풀 재사용을 위해 프로세스 전역 클라이언트 공유
+        self.openai_client = _get_openai_client(api_key)
         # 환경변수에서 모델명 읽기 (기본값: gpt-5)
         self.model = os.getenv("LLM_MODEL", "gpt-5")
 
@@ -70,18 +157,36 @@ class BaseAgent(LoggerMixin, ABC):
         pass
     
     @abstractmethod
-    def parse_response(self, response_text: str) -> Dict[str, Any]:
+    def parse_response(self, response_text: str, input_data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         AI 응답을 파싱하여 구조화된 데이터로 변환
-        
+
         Args:
             response_text: AI의 응답 텍스트
-            
+            input_data: 해당 호출의 원본 입력 데이터 (폴백 처리 참고용)
+
         Returns:
             파싱된 결과 딕셔너리
         """
         pass
-    
+
+    def _cached_system_prompt(self) -> str:
+        """
+        시스템 프롬프트를 에이전트 클래스 단위로 메모이즈하여 반환
+
+        시스템 프롬프트는 에이전트별 정적 문자열이므로 호출마다
+        get_system_prompt()를 재실행할 필요가 없음
+
+        Returns:
+            캐시된 시스템 프롬프트 문자열
+        """
+        cls = type(self)
+        prompt = cls.__dict__.get("_system_prompt_cache")
+        if prompt is None:
+            prompt = self.get_system_prompt()
+            cls._system_prompt_cache = prompt
+        return prompt
+
     async def process(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
         에이전트의 핵심 처리 메서드
@@ -97,8 +202,8 @@ class BaseAgent(LoggerMixin, ABC):
             ValueError: 입력 데이터 검증 실패
             Exception: 처리 중 예외 발생
         """
-        start_time = asyncio.get_event_loop().time()
-        
+        start_time = time.perf_counter()
+
         self.log_info(f"🚀 {self.agent_name} 처리 시작", data={
             "input_keys": list(data.keys())
         })
@@ -107,8 +212,8 @@ class BaseAgent(LoggerMixin, ABC):
             # 타임아웃 없음 - 긴 영상 처리 지원
             result = await self._process_with_retry(data)
             
-            processing_time = asyncio.get_event_loop().time() - start_time
-            
+            processing_time = time.perf_counter() - start_time
+
             self.log_info(f"✅ {self.agent_name} 처리 완료", data={
                 "processing_time": f"{processing_time:.2f}초",
                 "output_keys": list(result.keys())
@@ -117,7 +222,7 @@ class BaseAgent(LoggerMixin, ABC):
             return result
             
         except Exception as e:
-            processing_time = asyncio.get_event_loop().time() - start_time
+            processing_time = time.perf_counter() - start_time
             self.log_error(f"❌ {self.agent_name} 처리 실패", data={
                 "error": str(e),
                 "error_type": type(e).__name__,
@@ -125,6 +230,124 @@ class BaseAgent(LoggerMixin, ABC):
             })
             raise
     
+    async def process_batch(self, data_list: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        여러 작업을 OpenAI Batch API로 일괄 처리 (비대화형 파이프라인용)
+
+        실시간 응답이 필요 없는 대량 처리에서 토큰 비용 50% 절감 및
+        분당 요청 제한 우회가 가능. USE_BATCH_API=1 환경변수로 활성화.
+
+        Args:
+            data_list: 처리할 입력 데이터 리스트
+
+        Returns:
+            입력 순서와 동일한 처리 결과 리스트
+        """
+        if not data_list:
+            return []
+
+        self.log_info(f"📦 {self.agent_name} 배치 처리 시작", data={
+            "job_count": len(data_list)
+        })
+
+        # 1. 작업별 JSONL 라인 구성
+        jsonl_lines = []
+        for i, data in enumerate(data_list):
+            self._validate_input(data)
+
+            system_prompt = self._cached_system_prompt()
+            user_prompt = self.format_user_prompt(data)
+            full_prompt = f"{system_prompt}\n\n{user_prompt}"
+
+            body = {
+                "model": self.model,
+                "input": full_prompt,
+                "text": {"verbosity": "medium"}
+            }
+            if self.model == "gpt-5":
+                body["reasoning"] = {"effort": "medium"}
+
+            # orjson은 bytes를 바로 반환하므로 str 인코딩 왕복 없이 파일 구성
+            jsonl_lines.append(orjson.dumps({
+                "custom_id": str(i),
+                "method": "POST",
+                "url": "/v1/responses",
+                "body": body
+            }))
+
+        # 2. 입력 파일 업로드 및 배치 생성
+        jsonl_bytes = b"\n".join(jsonl_lines)
+        input_file = await self.openai_client.files.create(
+            file=io.BytesIO(jsonl_bytes),
+            purpose="batch"
+        )
+
+        batch = await self.openai_client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/responses",
+            completion_window="24h"
+        )
+
+        self.log_info(f"📤 {self.agent_name} 배치 제출 완료", data={
+            "batch_id": batch.id,
+            "job_count": len(data_list)
+        })
+
+        # 3. 완료까지 폴링 (지수 백오프, 최대 60초 간격)
+        poll_interval = 5
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            await asyncio.sleep(poll_interval)
+            poll_interval = min(poll_interval * 2, 60)
+            batch = await self.openai_client.batches.retrieve(batch.id)
+
+            self.log_debug(f"⏳ {self.agent_name} 배치 상태 확인", data={
+                "batch_id": batch.id,
+                "status": batch.status
+            })
+
+        if batch.status != "completed":
+            raise RuntimeError(f"배치 처리 실패: {batch.status} (batch_id={batch.id})")
+
+        # 4. 출력 파일 다운로드 및 custom_id 기준 매핑
+        output_content = await self.openai_client.files.content(batch.output_file_id)
+        outputs_by_id = {}
+        for line in output_content.text.splitlines():
+            if not line.strip():
+                continue
+            record = orjson.loads(line)
+            response_body = (record.get("response") or {}).get("body") or {}
+
+            # Responses API 출력에서 텍스트 추출
+            text_parts = []
+            for item in response_body.get("output", []):
+                for content in item.get("content", []):
+                    if content.get("type") == "output_text":
+                        text_parts.append(content.get("text", ""))
+            outputs_by_id[record["custom_id"]] = "".join(text_parts)
+
+        # 5. 입력 순서대로 파싱 및 검증
+        results = []
+        for i in range(len(data_list)):
+            response_text = outputs_by_id.get(str(i))
+            if response_text is None:
+                raise ValueError(f"배치 결과에 작업 {i}번 응답이 없습니다.")
+
+            result = self.parse_response(_strip_json_fence(response_text), data_list[i])
+            self._validate_output(result)
+            results.append(result)
+
+        self.log_info(f"✅ {self.agent_name} 배치 처리 완료", data={
+            "batch_id": batch.id,
+            "result_count": len(results)
+        })
+
+        return results
+
+    @staticmethod
+    def batch_api_enabled() -> bool:
+        """배치 API 사용 여부 (USE_BATCH_API 환경변수)"""
+        return os.getenv("USE_BATCH_API", "0") == "1"
+
     async def _process_with_retry(self, data: Dict[str, Any], max_retries: int = 3) -> Dict[str, Any]:
         """
         재시도 로직이 포함된 내부 처리 메서드
@@ -143,76 +366,147 @@ class BaseAgent(LoggerMixin, ABC):
                 
                 # 입력 데이터 검증
                 self._validate_input(data)
-                
-                # AI API 호출
-                result = await self._call_ai_api(data)
-                
+
+                # AI API 호출 (재시도에서는 직전 실패 응답 재생에 고정되지 않도록 캐시 우회)
+                result, pending_cache = await self._call_ai_api(data, use_cache=attempt == 0)
+
                 # 결과 검증
                 self._validate_output(result)
-                
+
+                # 출력 검증까지 통과한 응답만 캐시
+                # (검증 실패 응답을 캐시하면 재시도가 같은 응답에 고정됨)
+                if pending_cache is not None:
+                    cache_key, response_text = pending_cache
+                    await get_llm_cache().set(cache_key, response_text)
+
                 return result
                 
             except Exception as e:
                 if attempt == max_retries:
                     # 마지막 시도에서도 실패하면 예외 전파
                     raise
-                
+
+                # 비일시적 API 오류(4xx, 429 제외)는 재시도해도 동일하게 실패하므로 즉시 전파
+                if isinstance(e, APIStatusError) and not isinstance(e, RateLimitError) and e.status_code < 500:
+                    raise
+
+                # 지수 백오프 + 지터 (동시 실패한 에이전트들의 재시도 쏠림 방지), 상한 적용
+                delay = min(_MAX_BACKOFF, random.uniform(1.0, 3.0 * (2 ** attempt)))
+
+                # 429 응답에 Retry-After 헤더가 있으면 해당 값 우선
+                if isinstance(e, RateLimitError):
+                    retry_after = e.response.headers.get("retry-after")
+                    if retry_after:
+                        try:
+                            delay = min(_MAX_BACKOFF, float(retry_after))
+                        except ValueError:
+                            pass
+
                 self.log_warning(f"⚠️ {self.agent_name} 시도 {attempt + 1} 실패, 재시도 중...", data={
                     "error": str(e),
-                    "retry_in": 2 ** attempt  # 지수 백오프
+                    "retry_in": f"{delay:.1f}초"
                 })
-                
-                # 지수 백오프로 대기
-                await asyncio.sleep(2 ** attempt)
+
+                await asyncio.sleep(delay)
     
-    async def _call_ai_api(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    async def _call_ai_api(self, data: Dict[str, Any], use_cache: bool = True) -> tuple:
         """
         OpenAI API 호출 및 응답 처리
-        
+
         Args:
             data: 입력 데이터
-            
+            use_cache: 응답 캐시 조회 여부 (재시도에서는 False로 우회)
+
         Returns:
-            파싱된 AI 응답
+            (파싱된 AI 응답, 캐시 보류 항목) 튜플
+            - 캐시 보류 항목은 (cache_key, response_text) 또는 None으로,
+              출력 검증을 통과한 뒤 호출자가 캐시에 적재한다
         """
-        system_prompt = self.get_system_prompt()
+        system_prompt = self._cached_system_prompt()
         user_prompt = self.format_user_prompt(data)
-        
+
         self.log_debug(f"📤 {self.agent_name} API 호출", data={
             "system_prompt_length": len(system_prompt),
             "user_prompt_length": len(user_prompt),
             "model": self.model
         })
         
-        # 모델에 따른 API 호출 분기
-        full_prompt = f"{system_prompt}\n\n{user_prompt}"
+        # 응답 캐시 확인 - 동일 프롬프트 재호출 시 API 호출 생략
+        call_params = {"reasoning": "medium", "verbosity": "medium"}
+        cache = get_llm_cache()
+        cache_key = cache.make_key(self.model, f"{system_prompt}\n\n{user_prompt}", call_params)
+
+        if use_cache:
+            cached_text = await cache.get(cache_key)
+            if cached_text is not None:
+                self.log_info(f"💾 {self.agent_name} 캐시 적중, API 호출 생략", data={
+                    "cache_key": cache_key[:16],
+                    "response_length": len(cached_text)
+                })
+                parsed = await asyncio.to_thread(
+                    lambda: self.parse_response(_strip_json_fence(cached_text), data)
+                )
+                return parsed, None
 
+        # 모델별 호출 파라미터 구성
+        # 시스템/사용자 프롬프트를 분리된 메시지로 전달 - 호출마다 동일한
+        # 시스템 프롬프트가 선두 프리픽스로 고정되어 OpenAI 서버측
+        # 프롬프트 프리픽스 캐시에 적중 (반복 호출 시 프리필 비용 절감)
+        request_kwargs = {
+            "model": self.model,
+            "input": [
+                {
+                    "role": "system",
+                    "content": [{"type": "input_text", "text": system_prompt}]
+                },
+                {
+                    "role": "user",
+                    "content": [{"type": "input_text", "text": user_prompt}]
+                }
+            ],
+            "text": {"verbosity": "medium"}  # 중간 수준의 상세도
+        }
         if self.model == "gpt-5":
-            # GPT-5 API 호출 (CLAUDE.md 형식)
-            response = self.openai_client.responses.create(
-                model=self.model,
-                input=full_prompt,
-                reasoning={"effort": "medium"},  # 중간 수준의 추론
-                text={"verbosity": "medium"}  # 중간 수준의 상세도
-            )
-        else:
-            # 다른 모델들은 reasoning 파라미터 제거
-            response = self.openai_client.responses.create(
-                model=self.model,
-                input=full_prompt,
-                text={"verbosity": "medium"}  # 상세도만 유지
-            )
-
-        response_text = response.output_text
-        
+            # GPT-5 API 호출 (CLAUDE.md 형식) - reasoning 파라미터 추가
+            request_kwargs["reasoning"] = {"effort": "medium"}
+
+        # 동시 호출 수 제한 + 토큰 버킷으로 호출 페이싱 (429 방지)
+        async with _api_semaphore:
+            await _api_rate_limiter.acquire()
+
+            if os.getenv("LLM_STREAMING", "0") == "1":
+                # 스트리밍 모드 - 델타를 수신 즉시 리스트에 모아 네트워크 수신과
+                # 파이썬 처리를 겹침 (전체 버퍼링 대비 체감 지연 감소)
+                text_parts = []
+                stream = await self.openai_client.responses.create(
+                    **request_kwargs, stream=True
+                )
+                async for event in stream:
+                    if event.type == "response.output_text.delta":
+                        text_parts.append(event.delta)
+                response_text = "".join(text_parts)
+            else:
+                response = await self.openai_client.responses.create(**request_kwargs)
+                response_text = response.output_text
+
         self.log_debug(f"📥 {self.agent_name} API 응답 수신", data={
             "response_length": len(response_text)
         })
-        
-        # 응답 파싱
-        parsed_result = self.parse_response(response_text)
-        
-        return parsed_result
+
+        # 응답 파싱 - 수십 KB JSON 디코드/정규식 스캔이 이벤트 루프를 막지 않도록
+        # 워커 스레드에서 수행 (다른 요청의 네트워크 I/O와 병행)
+        # 펜스 제거와 캐시 게이트용 JSON 판정도 같은 스레드 호출에서 함께 처리
+        def _parse_and_gate():
+            text = _strip_json_fence(response_text)
+            return self.parse_response(text, data), (text if _is_json_text(text) else None)
+
+        parsed_result, cacheable_text = await asyncio.to_thread(_parse_and_gate)
+
+        # 캐시 적재는 출력 검증을 통과한 뒤 호출자가 수행하도록 보류
+        # (JSON이 아닌 응답은 폴백 파싱 결과이므로 캐시 대상에서 제외,
+        #  캐시에는 펜스를 벗긴 본문을 저장해 적중 시에도 파서와 동일 입력 보장)
+        pending_cache = (cache_key, cacheable_text) if cacheable_text is not None else None
+        return parsed_result, pending_cache
     
     def _validate_input(self, data: Dict[str, Any]) -> None:
         """
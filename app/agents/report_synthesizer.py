@@ -2,11 +2,80 @@
 보고서 종합 에이전트 (Report Synthesis Agent)
 주제 클러스터와 구조 설계를 바탕으로 최종 종합 분석 보고서 생성
 """
+import functools
 import json
 import re
+import orjson
 from typing import Dict, Any, List
 from app.agents.base_agent import BaseAgent
 
+# 자주 사용하는 정규식은 임포트 시점에 한 번만 컴파일 (파싱 핫패스용)
+_H2_RE = re.compile(r'^## ', re.MULTILINE)
+_H3_RE = re.compile(r'^### (.+)$', re.MULTILINE)
+_MD_STRIP_RE = re.compile(r'[#*`>-]')
+_WS_RE = re.compile(r'\s+')
+_KOREAN_RE = re.compile(r'[가-힣]')
+_ENGLISH_WORD_RE = re.compile(r'\b[a-zA-Z]+\b')
+_NUMBER_RE = re.compile(r'\b\d+\b')
+_SENTENCE_SPLIT_RE = re.compile(r'[.!?]')
+_FALLBACK_KEY_RE = re.compile(r'"final_report"\s*:\s*(?=")')
+_FALLBACK_HEAD_RE = re.compile(r'^\s*{\s*"final_report"\s*:\s*"')
+_FALLBACK_TAIL_RE = re.compile(r'",?\s*"report_metadata".*}?\s*$')
+_QUOTE_EDGE_RE = re.compile(r'^"|"$')
+
+# 콘텐츠 유형/주제 키워드 - 키워드별 개별 스캔 대신 통합 패턴으로 한 번만 순회
+_CONTENT_TYPE_KEYWORDS = {
+    '토론': ['토론', '논쟁', '찬반', '의견'],
+    '강의': ['강의', '교육', '설명', '학습'],
+    '인터뷰': ['인터뷰', '질문', '답변', 'Q&A'],
+    '뉴스': ['뉴스', '보도', '사건', '발표'],
+    '리뷰': ['리뷰', '평가', '분석', '검토'],
+    '브이로그': ['일상', '경험', '여행', '생활']
+}
+_CONTENT_TYPE_SCAN_RE = re.compile('|'.join(
+    re.escape(kw) for kws in _CONTENT_TYPE_KEYWORDS.values() for kw in kws
+))
+_COMMON_TOPICS = [
+    '주식', '투자', '경제', '정치', '기술', '사회', '문화', '스포츠',
+    '게임', '영화', '음악', '여행', '음식', '건강', '교육', '환경'
+]
+_COMMON_TOPIC_SCAN_RE = re.compile('|'.join(map(re.escape, _COMMON_TOPICS)))
+
+@functools.lru_cache(maxsize=256)
+def _count_words_cached(text: str) -> int:
+    """
+    Markdown 제거 후 단어 수 계산 (한글 글자 + 영단어 + 숫자)
+
+    폴백/재시도 경로에서 같은 보고서 전문이 다시 계산되는 경우가 있어
+    텍스트 단위로 결과를 메모이즈함
+    """
+    clean_text = _MD_STRIP_RE.sub('', text)
+    clean_text = _WS_RE.sub(' ', clean_text)
+
+    korean_chars = len(_KOREAN_RE.findall(clean_text))
+    english_words = len(_ENGLISH_WORD_RE.findall(clean_text))
+    numbers = len(_NUMBER_RE.findall(clean_text))
+
+    # 한글은 글자 수, 영어는 단어 수로 계산
+    return korean_chars + english_words + numbers
+
+
+# 반복률 검증을 수행할 보고서 길이 상한 (문자 수)
+# 초대형 보고서에서는 문장 set 구축 비용이 경고 로그 하나의 가치를 넘어섬
+_REPETITION_CHECK_MAX_CHARS = 100_000
+
+# 단일 패스 분석용 통합 패턴 - 헤딩/한글/영단어/숫자/문장 경계를 한 번에 스캔
+# (헤딩은 마커만 소비하고 제목은 lookahead로 캡처해 제목 단어도 집계에 포함,
+#  영단어/숫자는 _count_words_cached와 동일하게 단어 경계 기준으로 매칭)
+_REPORT_SCAN_RE = re.compile(
+    r'(?m)(?P<h3>^### (?=(?P<h3_title>.+)$))'
+    r'|(?P<h2>^## )'
+    r'|(?P<kor>[가-힣])'
+    r'|(?P<eng>\b[a-zA-Z]+\b)'
+    r'|(?P<num>\b\d+\b)'
+    r'|(?P<sent>[.!?])'
+)
+
 
 class ReportSynthesizerAgent(BaseAgent):
     """
@@ -21,10 +90,10 @@ class ReportSynthesizerAgent(BaseAgent):
     
     def __init__(self):
         super().__init__("report_synthesizer")  # 타임아웃 없음
-    
-    def get_system_prompt(self) -> str:
-        """보고서 종합 전문가 시스템 프롬프트"""
-        return """당신은 뛰어난 분석가이자 전문 작가입니다. 당신은 복잡한 데이터와 명확한 구조 설계도를 받아, 이를 바탕으로 매우 상세하고 논리 정연하며 가독성 높은 종합 보고서를 작성할 수 있습니다.
+
+    # 시스템 프롬프트는 완전히 정적이므로 호출마다 리터럴을 재평가하지 않도록
+    # 클래스 상수로 한 번만 생성
+    _SYSTEM_PROMPT = """당신은 뛰어난 분석가이자 전문 작가입니다. 당신은 복잡한 데이터와 명확한 구조 설계도를 받아, 이를 바탕으로 매우 상세하고 논리 정연하며 가독성 높은 종합 보고서를 작성할 수 있습니다.
 
 # 컨텍스트 (Context)
 당신은 두 가지 핵심 자료를 받게 됩니다:
@@ -77,49 +146,56 @@ class ReportSynthesizerAgent(BaseAgent):
 }
 
 JSON 형식을 정확히 지켜주세요."""
-    
+
+    def get_system_prompt(self) -> str:
+        """보고서 종합 전문가 시스템 프롬프트"""
+        return self._SYSTEM_PROMPT
+
     def format_user_prompt(self, data: Dict[str, Any]) -> str:
         """사용자 프롬프트 생성"""
         topic_clusters = data.get("topic_clusters", [])
         report_structure = data.get("report_structure", [])
         content_type = data.get("content_type", "일반")
         
-        # 구조 설계도 포맷팅
-        structure_guide = f"**콘텐츠 유형**: {content_type}\n\n"
-        structure_guide += "**보고서 구조**:\n"
-        
+        # 구조 설계도 포맷팅 (+= 문자열 누적은 O(n²)이라 리스트에 모아 한 번에 join)
+        structure_parts = [f"**콘텐츠 유형**: {content_type}\n\n", "**보고서 구조**:\n"]
+
         for section in report_structure:
             section_name = section.get("section_name", "")
             section_description = section.get("section_description", "")
             required_topics = section.get("required_topics", [])
             section_order = section.get("section_order", 0)
-            
-            structure_guide += f"{section_order}. **{section_name}**\n"
-            structure_guide += f"   - 설명: {section_description}\n"
-            structure_guide += f"   - 포함할 주제: {', '.join(required_topics)}\n\n"
-        
+
+            structure_parts.append(f"{section_order}. **{section_name}**\n")
+            structure_parts.append(f"   - 설명: {section_description}\n")
+            structure_parts.append(f"   - 포함할 주제: {', '.join(required_topics)}\n\n")
+
+        structure_guide = "".join(structure_parts)
+
         # 주제별 콘텐츠 데이터 포맷팅
-        content_data = ""
+        content_parts = []
         for i, cluster in enumerate(topic_clusters):
             topic_title = cluster.get("topic_title", f"주제 {i+1}")
             topic_summary = cluster.get("topic_summary", "")
             importance_score = cluster.get("importance_score", 0.5)
             related_utterances = cluster.get("related_utterances", [])
-            
-            content_data += f"## 주제: {topic_title}\n"
-            content_data += f"**요약**: {topic_summary}\n"
-            content_data += f"**중요도**: {importance_score:.1f}\n"
-            content_data += f"**관련 발화 ({len(related_utterances)}개)**:\n"
-            
+
+            content_parts.append(f"## 주제: {topic_title}\n")
+            content_parts.append(f"**요약**: {topic_summary}\n")
+            content_parts.append(f"**중요도**: {importance_score:.1f}\n")
+            content_parts.append(f"**관련 발화 ({len(related_utterances)}개)**:\n")
+
             for j, utterance in enumerate(related_utterances):
                 speaker = utterance.get("speaker", "Unknown")
                 text = utterance.get("text", "")
                 confidence = utterance.get("confidence", 0.8)
-                
-                content_data += f"{j+1}. [{speaker}] (신뢰도: {confidence:.1f}): {text}\n"
-            
-            content_data += "\n"
-        
+
+                content_parts.append(f"{j+1}. [{speaker}] (신뢰도: {confidence:.1f}): {text}\n")
+
+            content_parts.append("\n")
+
+        content_data = "".join(content_parts)
+
         return f"""다음 구조 설계도와 콘텐츠 데이터를 바탕으로 종합 분석 보고서를 작성해주세요:
 
 ---
@@ -132,12 +208,12 @@ JSON 형식을 정확히 지켜주세요."""
 
 위의 구조 설계도에 따라, 콘텐츠 데이터의 모든 정보를 활용하여 완전한 보고서를 작성해주세요. 각 섹션은 해당하는 주제의 발화들을 종합하여 논리적이고 체계적으로 서술해야 합니다. JSON 형식으로 응답해주세요."""
     
-    def parse_response(self, response_text: str) -> Dict[str, Any]:
+    def parse_response(self, response_text: str, input_data: Dict[str, Any] = None) -> Dict[str, Any]:
         """AI 응답 파싱"""
         try:
-            # JSON 응답 파싱
-            parsed = json.loads(response_text)
-            
+            # JSON 응답 파싱 (orjson - 대용량 한글 보고서에서 stdlib 대비 수 배 빠름)
+            parsed = orjson.loads(response_text)
+
             # 필수 필드 검증
             if "final_report" not in parsed:
                 raise ValueError("final_report 필드가 응답에 없습니다.")
@@ -153,19 +229,22 @@ JSON 형식을 정확히 지켜주세요."""
             if len(final_report) < 500:
                 raise ValueError("보고서가 너무 짧습니다 (최소 500자 필요).")
             
+            # 전문 스캔은 한 번만 수행하고 이후 단계에서 지표 재사용
+            report_metrics = self._analyze_report(final_report)
+
             # 단어 수 계산 (제공된 값이 없거나 부정확한 경우)
             if not isinstance(word_count, int) or word_count <= 0:
-                word_count = self._count_words(final_report)
-            
+                word_count = report_metrics["word_count"]
+
             # 메타데이터 정규화
             if not isinstance(report_metadata, dict):
                 report_metadata = {}
-            
+
             # 기본 메타데이터 설정
             default_metadata = {
-                "total_sections": len(re.findall(r'^## ', final_report, re.MULTILINE)),
+                "total_sections": report_metrics["h2_count"],
                 "content_type": self._extract_content_type(final_report),
-                "topics_covered": self._extract_topics(final_report),
+                "topics_covered": self._extract_topics(final_report, report_metrics["h3_titles"]),
                 "word_count_estimate": word_count
             }
             
@@ -180,8 +259,8 @@ JSON 형식을 정확히 지켜주세요."""
                 "word_count": word_count
             }
             
-            # 보고서 품질 검증
-            self._validate_report_quality(result)
+            # 보고서 품질 검증 (사전 계산된 지표 재사용)
+            self._validate_report_quality(result, report_metrics)
             
             self.log_debug("📄 보고서 종합 파싱 결과", data={
                 "word_count": word_count,
@@ -192,7 +271,7 @@ JSON 형식을 정확히 지켜주세요."""
             
             return result
             
-        except json.JSONDecodeError as e:
+        except (orjson.JSONDecodeError, json.JSONDecodeError) as e:
             # JSON 파싱 실패 시 텍스트 직접 사용 (폴백)
             self.log_warning("⚠️ JSON 파싱 실패, 텍스트 직접 사용", data={
                 "error": str(e),
@@ -218,12 +297,25 @@ JSON 형식을 정확히 지켜주세요."""
         Returns:
             기본적인 보고서 결과
         """
-        # JSON 관련 문자 정리
-        cleaned_text = re.sub(r'^\s*{\s*"final_report"\s*:\s*"', '', text)
-        cleaned_text = re.sub(r'",?\s*"report_metadata".*}?\s*$', '', cleaned_text)
-        cleaned_text = re.sub(r'^"|"$', '', cleaned_text)  # 시작/끝 따옴표 제거
-        cleaned_text = cleaned_text.replace('\\n', '\n')  # 이스케이프 문자 변환
-        
+        # 1차: "final_report" 값을 실제 JSON 디코더로 언이스케이프
+        # (정규식 치환은 중첩 따옴표나 \uXXXX 이스케이프를 훼손하고,
+        #  여러 번의 치환 패스로 문자열을 반복 재생성함)
+        cleaned_text = None
+        key_match = _FALLBACK_KEY_RE.search(text)
+        if key_match:
+            try:
+                cleaned_text, _ = json.JSONDecoder().raw_decode(text, key_match.end())
+            except json.JSONDecodeError:
+                cleaned_text = None
+
+        # 2차: 값 추출 자체가 불가능할 때만 기존 정규식 정리로 폴백
+        if cleaned_text is None:
+            cleaned_text = _FALLBACK_HEAD_RE.sub('', text)
+            cleaned_text = _FALLBACK_TAIL_RE.sub('', cleaned_text)
+            cleaned_text = _QUOTE_EDGE_RE.sub('', cleaned_text)  # 시작/끝 따옴표 제거
+            cleaned_text = cleaned_text.replace('\\n', '\n')  # 이스케이프 문자 변환
+
+
         # 기본 보고서 구조가 없으면 추가
         if not cleaned_text.startswith('#'):
             cleaned_text = f"# 종합 분석 보고서\n\n{cleaned_text}"
@@ -237,7 +329,7 @@ JSON 형식을 정확히 지켜주세요."""
         return {
             "final_report": cleaned_text,
             "report_metadata": {
-                "total_sections": len(re.findall(r'^## ', cleaned_text, re.MULTILINE)),
+                "total_sections": sum(1 for _ in _H2_RE.finditer(cleaned_text)),
                 "content_type": "일반",
                 "topics_covered": ["주요 내용"],
                 "word_count_estimate": word_count,
@@ -246,70 +338,114 @@ JSON 형식을 정확히 지켜주세요."""
             "word_count": word_count
         }
     
+    def _analyze_report(self, text: str, check_repetition: bool = None) -> Dict[str, Any]:
+        """
+        보고서 텍스트를 단일 패스로 분석하여 파싱/검증에 필요한 지표 수집
+
+        parse_response와 _validate_report_quality가 각각 전문을 여러 번
+        스캔하던 것을 한 번의 순회로 통합 (단어 수, 섹션 수, 문장 반복률)
+
+        Args:
+            text: 분석할 보고서 전문
+            check_repetition: 문장 반복률 지표 수집 여부
+                (None이면 길이 상한 기준으로 자동 결정)
+
+        Returns:
+            word_count, h2_count, h3_titles, sentence_count,
+            unique_sentence_count를 담은 딕셔너리
+            (반복률 검증을 건너뛰면 unique_sentence_count는 None)
+        """
+        if check_repetition is None:
+            check_repetition = len(text) <= _REPETITION_CHECK_MAX_CHARS
+
+        korean_chars = 0
+        english_words = 0
+        numbers = 0
+        h2_count = 0
+        h3_titles = []
+        sentence_count = 0
+        unique_sentences = set()
+        last_sentence_end = 0
+
+        for match in _REPORT_SCAN_RE.finditer(text):
+            group = match.lastgroup
+            if group == 'kor':
+                korean_chars += 1
+            elif group == 'eng':
+                english_words += 1
+            elif group == 'num':
+                numbers += 1
+            elif group == 'sent':
+                sentence_count += 1
+                if check_repetition:
+                    unique_sentences.add(text[last_sentence_end:match.start()])
+                    last_sentence_end = match.end()
+            elif group == 'h2':
+                h2_count += 1
+            else:  # h3 (마커만 소비하므로 제목 단어는 이후 순회에서 집계됨)
+                h3_titles.append(match.group('h3_title'))
+
+        # 마지막 구두점 이후 잔여 텍스트도 하나의 문장으로 취급
+        if check_repetition:
+            unique_sentences.add(text[last_sentence_end:])
+        sentence_count += 1
+
+        return {
+            "word_count": korean_chars + english_words + numbers,
+            "h2_count": h2_count,
+            "h3_titles": h3_titles,
+            "sentence_count": sentence_count,
+            "unique_sentence_count": len(unique_sentences) if check_repetition else None
+        }
+
     def _count_words(self, text: str) -> int:
-        """텍스트의 단어 수 계산"""
-        # Markdown 형식 제거 후 단어 수 계산
-        clean_text = re.sub(r'[#*`>-]', '', text)
-        clean_text = re.sub(r'\s+', ' ', clean_text)
-        
-        # 한글과 영어 모두 고려한 단어 수 계산
-        korean_chars = len(re.findall(r'[가-힣]', clean_text))
-        english_words = len(re.findall(r'\b[a-zA-Z]+\b', clean_text))
-        numbers = len(re.findall(r'\b\d+\b', clean_text))
-        
-        # 한글은 글자 수, 영어는 단어 수로 계산
-        return korean_chars + english_words + numbers
-    
+        """텍스트의 단어 수 계산 (동일 텍스트 재계산은 모듈 캐시에서 반환)"""
+        return _count_words_cached(text)
+
+
     def _extract_content_type(self, text: str) -> str:
         """보고서에서 콘텐츠 유형 추출"""
-        # 일반적인 콘텐츠 유형 키워드 검색
-        content_types = {
-            '토론': ['토론', '논쟁', '찬반', '의견'],
-            '강의': ['강의', '교육', '설명', '학습'],
-            '인터뷰': ['인터뷰', '질문', '답변', 'Q&A'],
-            '뉴스': ['뉴스', '보도', '사건', '발표'],
-            '리뷰': ['리뷰', '평가', '분석', '검토'],
-            '브이로그': ['일상', '경험', '여행', '생활']
-        }
-        
-        for content_type, keywords in content_types.items():
-            for keyword in keywords:
-                if keyword in text:
+        # 통합 패턴으로 전체 텍스트를 한 번만 스캔한 뒤 유형 우선순위대로 판정
+        found_keywords = set(_CONTENT_TYPE_SCAN_RE.findall(text))
+        if found_keywords:
+            for content_type, keywords in _CONTENT_TYPE_KEYWORDS.items():
+                if any(keyword in found_keywords for keyword in keywords):
                     return content_type
-        
+
         return '일반'
     
-    def _extract_topics(self, text: str) -> List[str]:
+    def _extract_topics(self, text: str, section_titles: List[str] = None) -> List[str]:
         """보고서에서 주요 주제 추출"""
         topics = []
-        
-        # 섹션 제목에서 주제 추출
-        section_titles = re.findall(r'^### (.+)$', text, re.MULTILINE)
+
+        # 섹션 제목에서 주제 추출 (사전 계산된 제목이 없으면 직접 스캔)
+        if section_titles is None:
+            section_titles = _H3_RE.findall(text)
         topics.extend(section_titles)
         
-        # 주요 키워드 추출 (간단한 패턴)
-        common_topics = [
-            '주식', '투자', '경제', '정치', '기술', '사회', '문화', '스포츠',
-            '게임', '영화', '음악', '여행', '음식', '건강', '교육', '환경'
-        ]
-        
-        for topic in common_topics:
-            if topic in text and topic not in topics:
+        # 주요 키워드 추출 - 키워드별 반복 스캔 대신 통합 패턴 단일 패스
+        found_topics = set(_COMMON_TOPIC_SCAN_RE.findall(text))
+        for topic in _COMMON_TOPICS:
+            if topic in found_topics and topic not in topics:
                 topics.append(topic)
         
         return topics[:10]  # 최대 10개까지
     
-    def _validate_report_quality(self, result: Dict[str, Any]) -> None:
+    def _validate_report_quality(self, result: Dict[str, Any], report_metrics: Dict[str, Any] = None) -> None:
         """생성된 보고서의 품질 검증"""
         final_report = result["final_report"]
         word_count = result["word_count"]
-        
+
+        # 사전 계산된 지표가 없으면 직접 스캔 (폴백 경로)
+        if report_metrics is None:
+            report_metrics = self._analyze_report(final_report)
+
         # 기본 구조 검증
         if not final_report.startswith('#'):
             self.log_warning("⚠️ 보고서가 제목(H1)으로 시작하지 않습니다.")
-        
+
         # 섹션 수 검증
-        h2_sections = len(re.findall(r'^## ', final_report, re.MULTILINE))
+        h2_sections = report_metrics["h2_count"]
         if h2_sections < 2:
             self.log_warning("⚠️ 보고서의 주요 섹션이 너무 적습니다.", data={
                 "section_count": h2_sections
@@ -325,14 +461,15 @@ JSON 형식을 정확히 지켜주세요."""
                 "word_count": word_count
             })
         
-        # 내용 다양성 검증
-        unique_sentences = len(set(re.split(r'[.!?]', final_report)))
-        repetition_ratio = 1 - (unique_sentences / max(1, len(re.split(r'[.!?]', final_report))))
-        
-        if repetition_ratio > 0.3:
-            self.log_warning("⚠️ 보고서에 반복적인 내용이 많을 수 있습니다.", data={
-                "repetition_ratio": repetition_ratio
-            })
+        # 내용 다양성 검증 (초대형 보고서에서는 비용 대비 효용이 낮아 생략)
+        unique_sentences = report_metrics["unique_sentence_count"]
+        if unique_sentences is not None:
+            repetition_ratio = 1 - (unique_sentences / max(1, report_metrics["sentence_count"]))
+
+            if repetition_ratio > 0.3:
+                self.log_warning("⚠️ 보고서에 반복적인 내용이 많을 수 있습니다.", data={
+                    "repetition_ratio": repetition_ratio
+                })
     
     def _validate_agent_specific_input(self, data: Dict[str, Any]) -> None:
         """보고서 종합 에이전트 특화 입력 검증"""
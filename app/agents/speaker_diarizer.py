@@ -3,10 +3,20 @@
 정제된 대본에서 언어적 단서를 활용하여 발화자를 식별하고 태깅
 """
 import json
+import logging
 import re
+import sys
+import orjson
 from typing import Dict, Any, List
 from app.agents.base_agent import BaseAgent
 
+# 폴백 경로에서 반복 사용하는 문장 분할 패턴은 임포트 시점에 한 번만 컴파일
+_SENT_RE = re.compile(r'[.!?]+\s+')
+
+# 화자 전환 단서 - 키워드별 개별 스캔 대신 통합 패턴으로 문장당 한 번만 검사
+_QUESTION_RE = re.compile(r'[?]|어떻게|왜|뭐')
+_SWITCH_RE = re.compile(r'\A(?:그런데|하지만|근데|아니|맞습니다|네|예)')
+
 
 class SpeakerDiarizationAgent(BaseAgent):
     """
@@ -21,10 +31,9 @@ class SpeakerDiarizationAgent(BaseAgent):
     
     def __init__(self):
         super().__init__("speaker_diarizer")  # 타임아웃 없음
-    
-    def get_system_prompt(self) -> str:
-        """화자 구분 전문가 시스템 프롬프트"""
-        return """당신은 대화 분석 전문가입니다. 당신은 오직 텍스트만으로 대화에 참여한 여러 명의 발화자를 구분해내는 뛰어난 능력을 가지고 있습니다.
+
+    # 정적 시스템 프롬프트는 클래스 상수로 한 번만 생성
+    _SYSTEM_PROMPT = """당신은 대화 분석 전문가입니다. 당신은 오직 텍스트만으로 대화에 참여한 여러 명의 발화자를 구분해내는 뛰어난 능력을 가지고 있습니다.
 
 # 컨텍스트 (Context)
 당신은 한 영상의 전체 대화 내용이 담긴 정제된 대본을 받게 됩니다. 이 대화에는 두 명 이상의 발화자가 참여할 수 있습니다.
@@ -70,7 +79,11 @@ class SpeakerDiarizationAgent(BaseAgent):
 }
 
 JSON 형식을 정확히 지켜주세요."""
-    
+
+    def get_system_prompt(self) -> str:
+        """화자 구분 전문가 시스템 프롬프트"""
+        return self._SYSTEM_PROMPT
+
     def format_user_prompt(self, data: Dict[str, Any]) -> str:
         """사용자 프롬프트 생성"""
         refined_transcript = data.get("refined_transcript", "")
@@ -84,11 +97,11 @@ JSON 형식을 정확히 지켜주세요."""
 
 위의 대본에서 언어적 스타일, 대화 흐름, 자기 지칭 표현, 내용의 일관성 등을 종합적으로 분석하여 발화자를 구분하고, 각 발화에 적절한 화자 레이블을 할당해주세요. JSON 형식으로 응답해주세요."""
     
-    def parse_response(self, response_text: str) -> Dict[str, Any]:
+    def parse_response(self, response_text: str, input_data: Dict[str, Any] = None) -> Dict[str, Any]:
         """AI 응답 파싱"""
         try:
-            # JSON 응답 파싱
-            parsed = json.loads(response_text)
+            # JSON 응답 파싱 (orjson - 대용량 발화 목록 파싱 가속)
+            parsed = orjson.loads(response_text)
             
             # 필수 필드 검증
             required_fields = ["speaker_tagged_transcript", "detected_speakers", "speaker_count"]
@@ -109,38 +122,51 @@ JSON 형식을 정확히 지켜주세요."""
             
             if not isinstance(speaker_count, int) or speaker_count <= 0:
                 raise ValueError("speaker_count는 양의 정수여야 합니다.")
+
+            # 발화 레코드와 같은 intern 객체를 공유하도록 화자 목록도 intern
+            # (출력 검증의 멤버십 비교가 포인터 비교로 단축됨)
+            detected_speakers = [sys.intern(str(s)) for s in detected_speakers]
             
             # 발화 데이터 검증 및 정규화
+            # 화자 집합/신뢰도 합계도 같은 순회에서 누적 (별도 재순회 제거)
             validated_utterances = []
+            found_speakers = set()
+            confidence_sum = 0.0
             for i, utterance in enumerate(speaker_tagged_transcript):
                 if not isinstance(utterance, dict):
                     raise ValueError(f"발화 {i}번이 딕셔너리 형태가 아닙니다.")
-                
+
                 if "speaker" not in utterance or "text" not in utterance:
                     raise ValueError(f"발화 {i}번에 speaker 또는 text 필드가 없습니다.")
-                
+
                 speaker = utterance["speaker"]
                 text = utterance["text"]
                 confidence = utterance.get("confidence", 0.8)  # 기본값
-                
-                # 신뢰도 정규화
-                if not isinstance(confidence, (int, float)):
+
+                # 신뢰도 정규화 - 대부분 정상 범위의 float이므로 빠른 경로 우선
+                # (수천 발화 기준 max/min/float 호출을 대부분 생략)
+                if type(confidence) is float and 0.0 <= confidence <= 1.0:
+                    pass
+                elif not isinstance(confidence, (int, float)):
                     confidence = 0.8
                 else:
                     confidence = max(0.0, min(1.0, float(confidence)))
-                
-                validated_utterances.append({
-                    "speaker": str(speaker),
+
+                # 화자 레이블은 소수의 값이 수천 발화에 반복되므로 intern으로 공유
+                entry = {
+                    "speaker": sys.intern(str(speaker)),
                     "text": str(text),
                     "confidence": confidence
-                })
-            
+                }
+                validated_utterances.append(entry)
+                found_speakers.add(entry["speaker"])
+                confidence_sum += confidence
+
             # 빈 결과 검증
             if len(validated_utterances) == 0:
                 raise ValueError("발화 데이터가 비어있습니다.")
-            
+
             # 화자 일관성 검증
-            found_speakers = set(utterance["speaker"] for utterance in validated_utterances)
             if len(found_speakers) != speaker_count:
                 self.log_warning("⚠️ 감지된 화자 수와 실제 사용된 화자 수가 다름", data={
                     "declared_count": speaker_count,
@@ -157,23 +183,27 @@ JSON 형식을 정확히 지켜주세요."""
                 "speaker_count": speaker_count
             }
             
-            self.log_debug("🎭 화자 구분 파싱 결과", data={
-                "total_utterances": len(validated_utterances),
-                "detected_speakers": detected_speakers,
-                "speaker_count": speaker_count,
-                "average_confidence": sum(u["confidence"] for u in validated_utterances) / len(validated_utterances)
-            })
+            # DEBUG 비활성 시 로그 데이터 구성 비용 자체를 생략
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.log_debug("🎭 화자 구분 파싱 결과", data={
+                    "total_utterances": len(validated_utterances),
+                    "detected_speakers": detected_speakers,
+                    "speaker_count": speaker_count,
+                    "average_confidence": confidence_sum / len(validated_utterances)
+                })
             
             return result
             
-        except json.JSONDecodeError as e:
+        except (orjson.JSONDecodeError, json.JSONDecodeError) as e:
             # JSON 파싱 실패 시 폴백 처리
             self.log_warning("⚠️ JSON 파싱 실패, 폴백 처리", data={
                 "error": str(e),
                 "response_preview": response_text[:300]
             })
             
-            return self._fallback_speaker_detection(response_text)
+            return self._fallback_speaker_detection(
+                response_text, (input_data or {}).get("refined_transcript")
+            )
         
         except Exception as e:
             self.log_error("❌ 화자 구분 파싱 오류", data={
@@ -182,38 +212,38 @@ JSON 형식을 정확히 지켜주세요."""
             })
             raise ValueError(f"화자 구분 결과 파싱 실패: {str(e)}")
     
-    def _fallback_speaker_detection(self, text: str) -> Dict[str, Any]:
+    def _fallback_speaker_detection(self, text: str, original_transcript: str = None) -> Dict[str, Any]:
         """
         JSON 파싱 실패 시 사용하는 간단한 화자 구분 함수
-        
+
         Args:
             text: 구분할 텍스트
-            
+            original_transcript: 입력 데이터의 정제된 자막 (없으면 text 사용)
+
         Returns:
             기본적인 화자 구분 결과
         """
         # 원본 자막을 문장 단위로 분할
-        if hasattr(self, '_last_input_transcript'):
-            original_transcript = self._last_input_transcript
-        else:
-            original_transcript = text
-        
-        sentences = self._split_sentences(original_transcript)
+        sentences = self._split_sentences(original_transcript or text)
         
         # 단순한 규칙 기반 화자 구분
+        # 수천 문장이 폴백에 몰릴 수 있어 루프 내 조회/복사를 최소화
+        # (문장은 _split_sentences에서 이미 strip됨)
         utterances = []
         current_speaker = "Speaker A"
         speaker_alternation_count = 0
-        
+        should_switch = self._should_switch_speaker
+        append_utterance = utterances.append
+
         for i, sentence in enumerate(sentences):
             # 간단한 화자 전환 감지 (질문 후 답변, 특정 키워드)
-            if self._should_switch_speaker(sentence, i):
+            if should_switch(sentence, i):
                 current_speaker = "Speaker B" if current_speaker == "Speaker A" else "Speaker A"
                 speaker_alternation_count += 1
-            
-            utterances.append({
+
+            append_utterance({
                 "speaker": current_speaker,
-                "text": sentence.strip(),
+                "text": sentence,
                 "confidence": 0.6  # 낮은 신뢰도
             })
         
@@ -236,25 +266,23 @@ JSON 형식을 정확히 지켜주세요."""
     def _split_sentences(self, text: str) -> List[str]:
         """텍스트를 문장 단위로 분할"""
         # 기본적인 문장 분할 (마침표, 물음표, 느낌표 기준)
-        sentences = re.split(r'[.!?]+\s+', text)
-        return [s.strip() for s in sentences if s.strip()]
+        # 제너레이터로 strip과 빈 문장 필터를 한 번의 순회로 처리
+        return [s for s in (part.strip() for part in _SENT_RE.split(text)) if s]
     
     def _should_switch_speaker(self, sentence: str, index: int) -> bool:
         """화자 전환 여부 결정"""
         # 질문 표시가 있으면 다음 문장에서 화자 전환
-        if '?' in sentence or '어떻게' in sentence or '왜' in sentence or '뭐' in sentence:
+        if _QUESTION_RE.search(sentence):
             return True
-        
-        # 특정 키워드로 화자 전환 감지
-        switch_keywords = ['그런데', '하지만', '근데', '아니', '맞습니다', '네', '예']
-        for keyword in switch_keywords:
-            if sentence.startswith(keyword):
-                return True
-        
+
+        # 특정 키워드로 화자 전환 감지 (문장 선두 통합 패턴 한 번으로 검사)
+        if _SWITCH_RE.match(sentence):
+            return True
+
         # 일정 길이마다 랜덤하게 전환 (너무 긴 단일 발화 방지)
         if index > 0 and index % 5 == 0:
             return True
-        
+
         return False
     
     def _validate_agent_specific_input(self, data: Dict[str, Any]) -> None:
@@ -267,14 +295,12 @@ JSON 형식을 정확히 지켜주세요."""
         if not isinstance(refined_transcript, str):
             raise ValueError("refined_transcript는 문자열이어야 합니다.")
         
-        if len(refined_transcript.strip()) == 0:
+        # strip()은 전체 복사본을 만들므로 공백 여부만 복사 없이 검사
+        if not refined_transcript or refined_transcript.isspace():
             raise ValueError("정제된 자막이 비어있습니다.")
         
         if len(refined_transcript) < 50:
             raise ValueError("자막이 너무 짧아 화자 구분이 어렵습니다 (최소 50자 필요).")
-        
-        # 입력 자막을 임시 저장 (폴백 처리용)
-        self._last_input_transcript = refined_transcript
     
     def _validate_agent_specific_output(self, result: Dict[str, Any]) -> None:
         """화자 구분 에이전트 특화 출력 검증"""
@@ -296,13 +322,14 @@ JSON 형식을 정확히 지켜주세요."""
         if speaker_count != len(detected_speakers):
             raise ValueError("화자 수와 감지된 화자 목록의 길이가 일치하지 않습니다.")
         
-        # 각 발화의 필수 필드 검증
+        # 각 발화의 필수 필드 검증 (화자 목록은 set으로 변환해 O(1) 조회)
+        speaker_set = frozenset(detected_speakers)
         for i, utterance in enumerate(speaker_tagged_transcript):
             if not isinstance(utterance, dict):
                 raise ValueError(f"발화 {i}번이 유효한 딕셔너리가 아닙니다.")
-            
+
             if "speaker" not in utterance or "text" not in utterance:
                 raise ValueError(f"발화 {i}번에 필수 필드가 없습니다.")
-            
-            if utterance["speaker"] not in detected_speakers:
+
+            if utterance["speaker"] not in speaker_set:
                 raise ValueError(f"발화 {i}번의 화자가 감지된 화자 목록에 없습니다.")
\ No newline at end of file
@@ -3,9 +3,31 @@
 주제 클러스터 데이터를 분석하여 최적의 보고서 구조와 포맷 결정
 """
 import json
+import logging
+import orjson
 from typing import Dict, Any, List
 from app.agents.base_agent import BaseAgent
 
+# 폴백용 범용 보고서 구조 템플릿 - 호출마다 리터럴을 재구성하지 않도록
+# 모듈 스코프에 한 번만 정의 (required_topics는 사용 시점에 채움)
+_BASIC_STRUCTURE_TEMPLATE = [
+    {
+        "section_name": "개요",
+        "section_description": "영상의 전반적인 내용과 핵심 메시지를 요약",
+        "section_order": 1
+    },
+    {
+        "section_name": "주요 내용 분석",
+        "section_description": "각 주제별로 상세한 내용과 논의사항을 정리",
+        "section_order": 2
+    },
+    {
+        "section_name": "결론 및 시사점",
+        "section_description": "영상의 전체적인 결론과 시청자에게 주는 시사점",
+        "section_order": 3
+    }
+]
+
 
 class StructureDesignerAgent(BaseAgent):
     """
@@ -20,10 +42,9 @@ class StructureDesignerAgent(BaseAgent):
     
     def __init__(self):
         super().__init__("structure_designer")  # 타임아웃 없음
-    
-    def get_system_prompt(self) -> str:
-        """보고서 구조 설계 전문가 시스템 프롬프트"""
-        return """당신은 콘텐츠 전략가이자 정보 아키텍트입니다. 당신은 주어진 정보의 성격을 파악하고, 독자가 가장 이해하기 쉬운 형태로 정보를 구조화하는 데 능숙합니다.
+
+    # 정적 시스템 프롬프트는 클래스 상수로 한 번만 생성
+    _SYSTEM_PROMPT = """당신은 콘텐츠 전략가이자 정보 아키텍트입니다. 당신은 주어진 정보의 성격을 파악하고, 독자가 가장 이해하기 쉬운 형태로 정보를 구조화하는 데 능숙합니다.
 
 # 컨텍스트 (Context)
 당신은 영상의 전체 내용이 여러 개의 주제 클러스터로 정리된 데이터를 받게 됩니다. 각 클러스터에는 주제명과 관련 발화들이 포함되어 있습니다.
@@ -99,31 +120,40 @@ class StructureDesignerAgent(BaseAgent):
 }
 
 JSON 형식을 정확히 지켜주세요."""
-    
+
+    def get_system_prompt(self) -> str:
+        """보고서 구조 설계 전문가 시스템 프롬프트"""
+        return self._SYSTEM_PROMPT
+
     def format_user_prompt(self, data: Dict[str, Any]) -> str:
         """사용자 프롬프트 생성"""
         topic_clusters = data.get("topic_clusters", [])
         
         # 주제 클러스터 정보를 읽기 쉽게 포맷
-        cluster_summary = ""
+        # (+= 문자열 누적은 O(n²)이라 리스트에 모아 한 번에 join)
+        summary_parts = []
+        cluster_get = dict.get  # 클러스터마다 바운드 메서드를 새로 만들지 않도록 호이스트
         for i, cluster in enumerate(topic_clusters):
-            topic_title = cluster.get("topic_title", f"주제 {i+1}")
-            topic_summary = cluster.get("topic_summary", "")
-            importance_score = cluster.get("importance_score", 0.5)
-            utterance_count = len(cluster.get("related_utterances", []))
-            
-            cluster_summary += f"{i+1}. **{topic_title}** (중요도: {importance_score:.1f}, 발화수: {utterance_count})\n"
+            topic_title = cluster_get(cluster, "topic_title", f"주제 {i+1}")
+            topic_summary = cluster_get(cluster, "topic_summary", "")
+            importance_score = cluster_get(cluster, "importance_score", 0.5)
+            related_utterances = cluster_get(cluster, "related_utterances", [])
+
+            summary_parts.append(
+                f"{i+1}. **{topic_title}** (중요도: {importance_score:.1f}, 발화수: {len(related_utterances)})\n"
+            )
             if topic_summary:
-                cluster_summary += f"   - {topic_summary}\n"
-            
+                summary_parts.append(f"   - {topic_summary}\n")
+
             # 대표 발화 몇 개 포함 (구조 설계 참고용)
-            utterances = cluster.get("related_utterances", [])[:3]  # 최대 3개
-            for utterance in utterances:
+            for utterance in related_utterances[:3]:  # 최대 3개
                 speaker = utterance.get("speaker", "Unknown")
                 text = utterance.get("text", "")[:100]  # 100자로 제한
-                cluster_summary += f"   - [{speaker}]: {text}...\n"
-            cluster_summary += "\n"
-        
+                summary_parts.append(f"   - [{speaker}]: {text}...\n")
+            summary_parts.append("\n")
+
+        cluster_summary = "".join(summary_parts)
+
         return f"""다음 주제 클러스터 데이터를 분석하여 최적의 보고서 구조를 설계해주세요:
 
 ---
@@ -140,11 +170,11 @@ JSON 형식을 정확히 지켜주세요."""
 
 JSON 형식으로 응답해주세요."""
     
-    def parse_response(self, response_text: str) -> Dict[str, Any]:
+    def parse_response(self, response_text: str, input_data: Dict[str, Any] = None) -> Dict[str, Any]:
         """AI 응답 파싱"""
         try:
-            # JSON 응답 파싱
-            parsed = json.loads(response_text)
+            # JSON 응답 파싱 (orjson - 대용량 클러스터 구조 파싱 가속)
+            parsed = orjson.loads(response_text)
             
             # 필수 필드 검증
             required_fields = ["content_type", "report_structure"]
@@ -156,8 +186,8 @@ JSON 형식으로 응답해주세요."""
             report_structure = parsed["report_structure"]
             structure_rationale = parsed.get("structure_rationale", "")
             
-            # 데이터 타입 검증
-            if not isinstance(content_type, str) or len(content_type.strip()) == 0:
+            # 데이터 타입 검증 (strip() 복사 없이 공백 여부만 검사)
+            if not isinstance(content_type, str) or not content_type or content_type.isspace():
                 raise ValueError("content_type는 비어있지 않은 문자열이어야 합니다.")
             
             if not isinstance(report_structure, list) or len(report_structure) == 0:
@@ -182,10 +212,10 @@ JSON 형식으로 응답해주세요."""
                 section_order = section["section_order"]
                 
                 # 각 필드 검증
-                if not isinstance(section_name, str) or len(section_name.strip()) == 0:
+                if not isinstance(section_name, str) or not section_name or section_name.isspace():
                     raise ValueError(f"섹션 {i}번의 section_name이 유효하지 않습니다.")
-                
-                if not isinstance(section_description, str) or len(section_description.strip()) == 0:
+
+                if not isinstance(section_description, str) or not section_description or section_description.isspace():
                     raise ValueError(f"섹션 {i}번의 section_description이 유효하지 않습니다.")
                 
                 if not isinstance(required_topics, list):
@@ -204,11 +234,14 @@ JSON 형식으로 응답해주세요."""
             # 섹션 순서 정렬
             validated_sections.sort(key=lambda x: x["section_order"])
             
-            # 중복 순서 검증
-            orders = [section["section_order"] for section in validated_sections]
-            if len(set(orders)) != len(orders):
+            # 중복 순서 검증 (정렬된 리스트이므로 인접 비교로 조기 종료)
+            has_duplicate_order = any(
+                validated_sections[i]["section_order"] == validated_sections[i - 1]["section_order"]
+                for i in range(1, len(validated_sections))
+            )
+            if has_duplicate_order:
                 self.log_warning("⚠️ 중복된 섹션 순서가 있어 자동 정렬됩니다.", data={
-                    "orders": orders
+                    "orders": [section["section_order"] for section in validated_sections]
                 })
                 # 순서 재할당
                 for i, section in enumerate(validated_sections):
@@ -220,23 +253,25 @@ JSON 형식으로 응답해주세요."""
                 "structure_rationale": structure_rationale.strip() if structure_rationale else f"{content_type} 형식으로 분석되어 해당 구조를 적용했습니다."
             }
             
-            self.log_debug("🏗️ 구조 설계 파싱 결과", data={
-                "content_type": result["content_type"],
-                "total_sections": len(validated_sections),
-                "section_names": [s["section_name"] for s in validated_sections],
-                "structure_rationale": result["structure_rationale"]
-            })
+            # DEBUG 비활성 시 로그 데이터 구성 비용 자체를 생략
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.log_debug("🏗️ 구조 설계 파싱 결과", data={
+                    "content_type": result["content_type"],
+                    "total_sections": len(validated_sections),
+                    "section_names": [s["section_name"] for s in validated_sections],
+                    "structure_rationale": result["structure_rationale"]
+                })
             
             return result
             
-        except json.JSONDecodeError as e:
+        except (orjson.JSONDecodeError, json.JSONDecodeError) as e:
             # JSON 파싱 실패 시 폴백 처리
             self.log_warning("⚠️ JSON 파싱 실패, 기본 구조 생성", data={
                 "error": str(e),
                 "response_preview": response_text[:300]
             })
             
-            return self._fallback_structure_design()
+            return self._fallback_structure_design((input_data or {}).get("topic_clusters"))
         
         except Exception as e:
             self.log_error("❌ 구조 설계 파싱 오류", data={
@@ -245,44 +280,30 @@ JSON 형식으로 응답해주세요."""
             })
             raise ValueError(f"구조 설계 결과 파싱 실패: {str(e)}")
     
-    def _fallback_structure_design(self) -> Dict[str, Any]:
+    def _fallback_structure_design(self, input_clusters: List[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         JSON 파싱 실패 시 사용하는 기본 구조 설계
-        
+
+        Args:
+            input_clusters: 입력 데이터의 주제 클러스터 목록
+
         Returns:
             기본적인 보고서 구조
         """
         # 입력된 주제 수에 따라 기본 구조 결정
-        input_topics = []
-        if hasattr(self, '_last_input_clusters'):
-            input_topics = [cluster.get("topic_title", f"주제 {i+1}") 
-                          for i, cluster in enumerate(self._last_input_clusters)]
-        
+        input_topics = [cluster.get("topic_title", f"주제 {i+1}")
+                        for i, cluster in enumerate(input_clusters or [])]
+
         if not input_topics:
             input_topics = ["주요 내용"]
         
-        # 범용 구조 생성
+        # 범용 구조 생성 (모듈 템플릿의 얕은 복사에 주제 목록만 주입)
         basic_structure = [
-            {
-                "section_name": "개요",
-                "section_description": "영상의 전반적인 내용과 핵심 메시지를 요약",
-                "required_topics": input_topics,
-                "section_order": 1
-            },
-            {
-                "section_name": "주요 내용 분석",
-                "section_description": "각 주제별로 상세한 내용과 논의사항을 정리",
-                "required_topics": input_topics,
-                "section_order": 2
-            },
-            {
-                "section_name": "결론 및 시사점",
-                "section_description": "영상의 전체적인 결론과 시청자에게 주는 시사점",
-                "required_topics": input_topics,
-                "section_order": 3
-            }
+            {**section, "required_topics": input_topics}
+            for section in _BASIC_STRUCTURE_TEMPLATE
         ]
-        
+
+
         return {
             "content_type": "일반",
             "report_structure": basic_structure,
@@ -312,9 +333,6 @@ JSON 형식으로 응답해주세요."""
             
             if "related_utterances" not in cluster:
                 raise ValueError(f"주제 클러스터 {i}번에 related_utterances 필드가 없습니다.")
-        
-        # 입력 클러스터를 임시 저장 (폴백 처리용)
-        self._last_input_clusters = topic_clusters
     
     def _validate_agent_specific_output(self, result: Dict[str, Any]) -> None:
         """구조 설계 에이전트 특화 출력 검증"""
@@ -326,7 +344,7 @@ JSON 형식으로 응답해주세요."""
         content_type = result["content_type"]
         report_structure = result["report_structure"]
         
-        if not isinstance(content_type, str) or len(content_type.strip()) == 0:
+        if not isinstance(content_type, str) or not content_type or content_type.isspace():
             raise ValueError("콘텐츠 유형이 유효하지 않습니다.")
         
         if not isinstance(report_structure, list) or len(report_structure) == 0:
@@ -3,10 +3,25 @@
 화자별 발화를 시간순서와 상관없이 의미론적 유사성에 따라 주제별로 클러스터링
 """
 import json
+import logging
 import re
+import sys
+import orjson
 from typing import Dict, Any, List, Set
 from app.agents.base_agent import BaseAgent
 
+# 폴백 키워드 추출용 상수/패턴은 임포트 시점에 한 번만 구성
+_COMMON_TOPICS = [
+    "주식", "투자", "경제", "시장", "정치", "사회", "기술", "과학",
+    "문화", "예술", "스포츠", "게임", "영화", "음악", "여행", "음식",
+    "건강", "의료", "교육", "법률", "환경", "에너지", "부동산"
+]
+_PROPER_NOUN_RE = re.compile(r'[A-Z][a-z]+')
+# 키워드별 개별 substring 스캔 대신 통합 패턴으로 텍스트를 한 번만 순회
+_COMMON_TOPIC_SCAN_RE = re.compile('|'.join(map(re.escape, _COMMON_TOPICS)))
+# ```json ... ``` 코드펜스로 감싼 응답도 폴백 없이 바로 파싱하기 위한 패턴
+_FENCE_RE = re.compile(r'```(?:json)?\s*(\{.*\})\s*```', re.S)
+
 
 class TopicCohesionAgent(BaseAgent):
     """
@@ -21,10 +36,9 @@ class TopicCohesionAgent(BaseAgent):
     
     def __init__(self):
         super().__init__("topic_cohesion")  # 타임아웃 없음
-    
-    def get_system_prompt(self) -> str:
-        """주제 응집 전문가 시스템 프롬프트"""
-        return """당신은 정보 구조화 전문가입니다. 당신의 특기는 시간 순서에 얽매이지 않고, 흩어져 있는 정보 조각들을 의미론적 유사성에 따라 하나의 완결된 주제로 묶어내는 것입니다.
+
+    # 정적 시스템 프롬프트는 클래스 상수로 한 번만 생성 (호출마다 리터럴 재평가 방지)
+    _SYSTEM_PROMPT = """당신은 정보 구조화 전문가입니다. 당신의 특기는 시간 순서에 얽매이지 않고, 흩어져 있는 정보 조각들을 의미론적 유사성에 따라 하나의 완결된 주제로 묶어내는 것입니다.
 
 # 컨텍스트 (Context)
 당신은 각 발화마다 화자 정보가 태깅된 전체 대본 데이터를 받게 됩니다. 영상의 특성상, 하나의 주제에 대한 논의가 영상의 여러 부분에 나뉘어 나타날 수 있습니다. 예를 들어, 'A 주식'에 대한 이야기가 영상 초반에 나왔다가, 다른 이야기를 한참 한 뒤에 후반부에 다시 이어질 수 있습니다.
@@ -81,18 +95,25 @@ class TopicCohesionAgent(BaseAgent):
 }
 
 JSON 형식을 정확히 지켜주세요."""
-    
+
+    def get_system_prompt(self) -> str:
+        """주제 응집 전문가 시스템 프롬프트"""
+        return self._SYSTEM_PROMPT
+
     def format_user_prompt(self, data: Dict[str, Any]) -> str:
         """사용자 프롬프트 생성"""
         speaker_tagged_transcript = data.get("speaker_tagged_transcript", [])
         
         # 발화 데이터를 읽기 쉬운 형태로 포맷
-        formatted_transcript = ""
-        for i, utterance in enumerate(speaker_tagged_transcript):
-            speaker = utterance.get("speaker", "Unknown")
-            text = utterance.get("text", "")
-            formatted_transcript += f"{i+1}. [{speaker}]: {text}\n"
-        
+        # (입력 검증 단계에서 같은 순회로 미리 만들어둔 결과가 있으면 재순회 생략.
+        #  싱글톤 에이전트에 요청 간 상태가 남지 않도록 data를 통해 전달받음)
+        formatted_transcript = data.pop("_preformatted_transcript", None)
+        if formatted_transcript is None:
+            formatted_transcript = "".join(
+                f"{i+1}. [{utterance.get('speaker', 'Unknown')}]: {utterance.get('text', '')}\n"
+                for i, utterance in enumerate(speaker_tagged_transcript)
+            )
+
         return f"""다음 화자별로 태깅된 대본을 분석하여 주제별로 클러스터링해주세요:
 
 ---
@@ -102,11 +123,16 @@ JSON 형식을 정확히 지켜주세요."""
 
 위의 대본에서 시간 순서와 관계없이 의미적으로 관련된 발화들을 주제별로 그룹화하고, 각 주제에 적절한 제목을 부여해주세요. 모든 발화가 하나 이상의 주제에 포함되도록 해주세요. JSON 형식으로 응답해주세요."""
     
-    def parse_response(self, response_text: str) -> Dict[str, Any]:
+    def parse_response(self, response_text: str, input_data: Dict[str, Any] = None) -> Dict[str, Any]:
         """AI 응답 파싱"""
         try:
-            # JSON 응답 파싱
-            parsed = json.loads(response_text)
+            # 코드펜스로 감싼 응답은 내부 JSON만 추출 (비싼 폴백 경로 회피)
+            fence_match = _FENCE_RE.search(response_text)
+            if fence_match:
+                response_text = fence_match.group(1)
+
+            # JSON 응답 파싱 (orjson - 대용량 발화 클러스터 파싱 가속)
+            parsed = orjson.loads(response_text)
             
             # 필수 필드 검증
             if "topic_clusters" not in parsed:
@@ -126,9 +152,12 @@ JSON 형식을 정확히 지켜주세요."""
                 raise ValueError("total_topics는 양의 정수여야 합니다.")
             
             # 각 주제 클러스터 검증 및 정규화
+            # 중요도 합계도 같은 순회에서 누적 (로그용 재순회 제거)
             validated_clusters = []
             total_utterances = 0
-            
+            importance_sum = 0.0
+
+
             for i, cluster in enumerate(topic_clusters):
                 if not isinstance(cluster, dict):
                     raise ValueError(f"주제 클러스터 {i}번이 딕셔너리 형태가 아닙니다.")
@@ -148,28 +177,33 @@ JSON 형식을 정확히 지켜주세요."""
                 if not isinstance(related_utterances, list) or len(related_utterances) == 0:
                     raise ValueError(f"주제 '{topic_title}'에 관련 발화가 없습니다.")
                 
-                # 각 발화 검증
+                # 각 발화 검증 (핫루프 - append 바인딩 및 신뢰도 빠른 경로)
                 validated_utterances = []
+                append_utterance = validated_utterances.append
                 for j, utterance in enumerate(related_utterances):
                     if not isinstance(utterance, dict):
                         raise ValueError(f"주제 '{topic_title}'의 발화 {j}번이 유효하지 않습니다.")
-                    
+
                     if "speaker" not in utterance or "text" not in utterance:
                         raise ValueError(f"주제 '{topic_title}'의 발화 {j}번에 필수 필드가 없습니다.")
-                    
+
                     speaker = utterance["speaker"]
                     text = utterance["text"]
                     confidence = utterance.get("confidence", 0.8)
-                    
-                    # 신뢰도 정규화
-                    if not isinstance(confidence, (int, float)):
+
+                    # 신뢰도 정규화 - 대부분 정상 범위의 float이므로 빠른 경로 우선
+                    if type(confidence) is float and 0.0 <= confidence <= 1.0:
+                        pass
+                    elif not isinstance(confidence, (int, float)):
                         confidence = 0.8
                     else:
                         confidence = max(0.0, min(1.0, float(confidence)))
-                    
-                    validated_utterances.append({
-                        "speaker": str(speaker),
-                        "text": str(text),
+
+                    # 화자 레이블은 소수의 값이 반복되므로 intern으로 공유
+                    # (JSON 파서가 이미 str을 만들어주므로 str() 재호출은 타입 확인 후에만)
+                    append_utterance({
+                        "speaker": sys.intern(speaker if type(speaker) is str else str(speaker)),
+                        "text": text if type(text) is str else str(text),
                         "confidence": confidence
                     })
                 
@@ -187,6 +221,7 @@ JSON 형식을 정확히 지켜주세요."""
                 })
                 
                 total_utterances += len(validated_utterances)
+                importance_sum += importance_score
             
             # 빈 결과 검증
             if len(validated_clusters) == 0:
@@ -201,7 +236,7 @@ JSON 형식을 정확히 지켜주세요."""
                 total_topics = len(validated_clusters)
             
             # 발화 누락 검증
-            original_utterance_count = len(self._last_input_utterances) if hasattr(self, '_last_input_utterances') else 0
+            original_utterance_count = len((input_data or {}).get("speaker_tagged_transcript", []))
             if original_utterance_count > 0 and total_utterances < original_utterance_count * 0.8:
                 self.log_warning("⚠️ 상당수의 발화가 주제에 할당되지 않았을 수 있음", data={
                     "original_count": original_utterance_count,
@@ -214,23 +249,27 @@ JSON 형식을 정확히 지켜주세요."""
                 "total_topics": total_topics
             }
             
-            self.log_debug("🎯 주제 응집 파싱 결과", data={
-                "total_topics": total_topics,
-                "total_utterances_clustered": total_utterances,
-                "average_importance": sum(c["importance_score"] for c in validated_clusters) / len(validated_clusters),
-                "topic_titles": [c["topic_title"] for c in validated_clusters]
-            })
+            # DEBUG 비활성 시 로그 데이터 구성 비용 자체를 생략
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.log_debug("🎯 주제 응집 파싱 결과", data={
+                    "total_topics": total_topics,
+                    "total_utterances_clustered": total_utterances,
+                    "average_importance": importance_sum / len(validated_clusters),
+                    "topic_titles": [c["topic_title"] for c in validated_clusters]
+                })
             
             return result
             
-        except json.JSONDecodeError as e:
+        except (orjson.JSONDecodeError, json.JSONDecodeError) as e:
             # JSON 파싱 실패 시 폴백 처리
             self.log_warning("⚠️ JSON 파싱 실패, 폴백 처리", data={
                 "error": str(e),
                 "response_preview": response_text[:300]
             })
             
-            return self._fallback_topic_clustering(response_text)
+            return self._fallback_topic_clustering(
+                response_text, (input_data or {}).get("speaker_tagged_transcript")
+            )
         
         except Exception as e:
             self.log_error("❌ 주제 응집 파싱 오류", data={
@@ -239,22 +278,38 @@ JSON 형식을 정확히 지켜주세요."""
             })
             raise ValueError(f"주제 응집 결과 파싱 실패: {str(e)}")
     
-    def _fallback_topic_clustering(self, text: str) -> Dict[str, Any]:
+    def _fallback_topic_clustering(self, text: str, input_utterances: List[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         JSON 파싱 실패 시 사용하는 간단한 주제 클러스터링 함수
-        
+
         Args:
             text: 클러스터링할 텍스트
-            
+            input_utterances: 입력 데이터의 화자 태깅 발화 목록
+
         Returns:
             기본적인 주제 클러스터링 결과
         """
-        if hasattr(self, '_last_input_utterances'):
-            utterances = self._last_input_utterances
+        if input_utterances:
+            utterances = input_utterances
         else:
             # 최악의 경우 단일 발화로 처리
             utterances = [{"speaker": "Speaker A", "text": text[:500], "confidence": 0.5}]
-        
+
+        # 소규모 입력에 공통 키워드도 없으면 클러스터링 자체가 무의미하므로
+        # frozenset 해싱 없이 바로 단일 주제로 수렴 (상수 시간 빠른 경로)
+        if len(utterances) < 5:
+            joined = " ".join(u.get("text", "") for u in utterances)
+            if not _COMMON_TOPIC_SCAN_RE.search(joined):
+                return {
+                    "topic_clusters": [{
+                        "topic_title": "전체 내용",
+                        "related_utterances": utterances,
+                        "topic_summary": "영상의 전반적인 내용",
+                        "importance_score": 1.0
+                    }],
+                    "total_topics": 1
+                }
+
         # 간단한 키워드 기반 클러스터링
         keyword_groups = self._extract_keyword_groups(utterances)
         
@@ -306,24 +361,13 @@ JSON 형식을 정확히 지켜주세요."""
     
     def _extract_keywords(self, text: str) -> Set[str]:
         """텍스트에서 간단한 키워드 추출"""
-        # 간단한 키워드 패턴 (명사형 단어들)
-        keywords = set()
-        
-        # 일반적인 주제 키워드들
-        common_topics = [
-            "주식", "투자", "경제", "시장", "정치", "사회", "기술", "과학", 
-            "문화", "예술", "스포츠", "게임", "영화", "음악", "여행", "음식",
-            "건강", "의료", "교육", "법률", "환경", "에너지", "부동산"
-        ]
-        
-        for topic in common_topics:
-            if topic in text:
-                keywords.add(topic)
-        
+        # 일반적인 주제 키워드들 (통합 패턴 단일 패스로 모든 키워드 수집)
+        keywords = set(_COMMON_TOPIC_SCAN_RE.findall(text))
+
         # 고유명사 패턴 (대문자로 시작하는 단어들)
-        proper_nouns = re.findall(r'[A-Z][a-z]+', text)
+        proper_nouns = _PROPER_NOUN_RE.findall(text)
         keywords.update(proper_nouns[:3])  # 최대 3개까지
-        
+
         return keywords
     
     def _validate_agent_specific_input(self, data: Dict[str, Any]) -> None:
@@ -338,21 +382,25 @@ JSON 형식을 정확히 지켜주세요."""
         
         if len(speaker_tagged_transcript) == 0:
             raise ValueError("화자별 발화 데이터가 비어있습니다.")
-        
-        # 각 발화 데이터 검증
+
+        # 각 발화 데이터 검증 + 프롬프트용 라인 포맷을 같은 순회에서 수행
+        # (검증/포맷 두 번 순회하던 것을 한 번으로 축소)
+        formatted_lines = []
+        append_line = formatted_lines.append
         for i, utterance in enumerate(speaker_tagged_transcript):
             if not isinstance(utterance, dict):
                 raise ValueError(f"발화 {i}번이 유효한 딕셔너리가 아닙니다.")
-            
+
             if "speaker" not in utterance or "text" not in utterance:
                 raise ValueError(f"발화 {i}번에 필수 필드가 없습니다.")
-        
+
+            append_line(f"{i+1}. [{utterance['speaker']}]: {utterance['text']}\n")
+
+        data["_preformatted_transcript"] = "".join(formatted_lines)
+
         # 클러스터링을 위해 충분한 발화가 있는지 검증
         if len(speaker_tagged_transcript) < 2:
             raise ValueError("주제 클러스터링을 위해서는 최소 2개 이상의 발화가 필요합니다.")
-        
-        # 입력 발화를 임시 저장 (폴백 처리 및 누락 검증용)
-        self._last_input_utterances = speaker_tagged_transcript
     
     def _validate_agent_specific_output(self, result: Dict[str, Any]) -> None:
         """주제 응집 에이전트 특화 출력 검증"""
@@ -4,9 +4,20 @@ ASR 오류가 포함된 원본 자막을 깨끗하고 가독성 높은 텍스트
 """
 import re
 import json
+import orjson
 from typing import Dict, Any
 from app.agents.base_agent import BaseAgent
 
+# 폴백 정제용 패턴은 임포트 시점에 한 번만 컴파일 (호출마다 재컴파일 방지)
+_JSON_PREFIX_RE = re.compile(r'^\s*{\s*"refined_transcript"\s*:\s*"')
+_JSON_SUFFIX_RE = re.compile(r'",?\s*"processing_notes".*}?\s*$')
+_QUOTE_EDGE_RE = re.compile(r'^"|"$')
+# 간투사는 단어별 개별 치환 대신 통합 패턴 한 번으로 제거 (긴 단어 우선)
+_FILLERS_RE = re.compile(r'\b(?:음|어|아|그니까|뭐|저기|그|이제|막)\b\s*')
+_WS_RE = re.compile(r'\s+')
+# ```json ... ``` 코드펜스로 감싼 응답도 폴백 없이 바로 파싱하기 위한 패턴
+_FENCE_RE = re.compile(r'```(?:json)?\s*(\{.*\})\s*```', re.S)
+
 
 class TranscriptRefinerAgent(BaseAgent):
     """
@@ -21,10 +32,9 @@ class TranscriptRefinerAgent(BaseAgent):
     
     def __init__(self):
         super().__init__("transcript_refiner")  # 타임아웃 없음
-    
-    def get_system_prompt(self) -> str:
-        """자막 정제 전문가 시스템 프롬프트"""
-        return """당신은 전문적인 교정 및 교열 전문가입니다. 당신의 임무는 자동 음성 인식(ASR)을 통해 생성된 자막 텍스트를 사람이 작성한 것처럼 자연스럽고 문법적으로 완벽한 문장으로 다듬는 것입니다.
+
+    # 정적 시스템 프롬프트는 클래스 상수로 한 번만 생성 (호출마다 리터럴 재평가 방지)
+    _SYSTEM_PROMPT = """당신은 전문적인 교정 및 교열 전문가입니다. 당신의 임무는 자동 음성 인식(ASR)을 통해 생성된 자막 텍스트를 사람이 작성한 것처럼 자연스럽고 문법적으로 완벽한 문장으로 다듬는 것입니다.
 
 # 컨텍스트 (Context)
 당신은 영상의 전체 자막 텍스트를 받게 됩니다. 이 텍스트는 오탈자, 문법 오류, 구두점 누락, 그리고 "음", "어", "그니까" 와 같은 불필요한 간투사를 포함하고 있을 수 있습니다.
@@ -49,7 +59,11 @@ class TranscriptRefinerAgent(BaseAgent):
 }
 
 JSON 형식을 정확히 지켜주세요."""
-    
+
+    def get_system_prompt(self) -> str:
+        """자막 정제 전문가 시스템 프롬프트"""
+        return self._SYSTEM_PROMPT
+
     def format_user_prompt(self, data: Dict[str, Any]) -> str:
         """사용자 프롬프트 생성"""
         transcript = data.get("transcript", "")
@@ -63,11 +77,16 @@ JSON 형식을 정확히 지켜주세요."""
 
 위의 자막을 오탈자 수정, 구두점 추가, 간투사 제거 등을 통해 깔끔하게 정제하되, 원본의 의미와 내용을 절대 변경하지 마십시오. JSON 형식으로 응답해주세요."""
     
-    def parse_response(self, response_text: str) -> Dict[str, Any]:
+    def parse_response(self, response_text: str, input_data: Dict[str, Any] = None) -> Dict[str, Any]:
         """AI 응답 파싱"""
         try:
-            # JSON 응답 파싱 시도
-            parsed = json.loads(response_text)
+            # 코드펜스로 감싼 응답은 내부 JSON만 추출 (비싼 폴백 경로 회피)
+            fence_match = _FENCE_RE.search(response_text)
+            if fence_match:
+                response_text = fence_match.group(1)
+
+            # JSON 응답 파싱 시도 (orjson - 대용량 자막 파싱 가속)
+            parsed = orjson.loads(response_text)
             
             # 필수 필드 검증
             if "refined_transcript" not in parsed:
@@ -86,14 +105,14 @@ JSON 형식을 정확히 지켜주세요."""
             }
             
             self.log_debug("📝 자막 정제 파싱 결과", data={
-                "original_length": len(self._last_input_transcript) if hasattr(self, '_last_input_transcript') else 0,
+                "original_length": len((input_data or {}).get("transcript", "")),
                 "refined_length": len(refined_transcript),
                 "processing_notes": processing_notes
             })
             
             return result
             
-        except json.JSONDecodeError as e:
+        except (orjson.JSONDecodeError, json.JSONDecodeError) as e:
             # JSON 파싱 실패 시 텍스트 직접 사용 (폴백)
             self.log_warning("⚠️ JSON 파싱 실패, 원본 텍스트 사용", data={
                 "error": str(e),
@@ -126,18 +145,16 @@ JSON 형식을 정확히 지켜주세요."""
             기본적으로 정제된 텍스트
         """
         # JSON 관련 문자 제거
-        text = re.sub(r'^\s*{\s*"refined_transcript"\s*:\s*"', '', text)
-        text = re.sub(r'",?\s*"processing_notes".*}?\s*$', '', text)
-        text = re.sub(r'^"|"$', '', text)  # 시작/끝 따옴표 제거
-        
-        # 기본적인 간투사 제거
-        filler_words = ['음', '어', '아', '그니까', '뭐', '저기', '그', '이제', '막']
-        for word in filler_words:
-            text = re.sub(f'\\b{word}\\b\\s*', '', text)
-        
+        text = _JSON_PREFIX_RE.sub('', text)
+        text = _JSON_SUFFIX_RE.sub('', text)
+        text = _QUOTE_EDGE_RE.sub('', text)  # 시작/끝 따옴표 제거
+
+        # 기본적인 간투사 제거 (9개 단어 개별 패스 → 통합 패턴 1회)
+        text = _FILLERS_RE.sub('', text)
+
         # 연속된 공백 정리
-        text = re.sub(r'\s+', ' ', text)
-        
+        text = _WS_RE.sub(' ', text)
+
         return text.strip()
     
     def _validate_agent_specific_input(self, data: Dict[str, Any]) -> None:
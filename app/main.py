@@ -2,12 +2,21 @@
 YouTube Summarizer API - 메인 애플리케이션
 FastAPI를 사용한 REST API 서버
 """
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel
 from typing import Optional
 import os
 import asyncio
+import hashlib
+import logging
+import time
+import uuid
+from contextlib import asynccontextmanager
+import orjson
+from functools import lru_cache
 from dotenv import load_dotenv
 
 from app.services.youtube_service import YouTubeService
@@ -17,10 +26,12 @@ from app.services.database_service import DatabaseService
 from app.services.multi_agent_service import MultiAgentService
 from app.services.user_service import UserService
 from app.services.fcm_service import get_fcm_service
+from app.services.cookie_refresher import get_cookie_refresher
 from app.models.summary import SummaryResponse, SummarizeRequest, MultiAgentAnalyzeRequest, MultiAgentAnalyzeResponse
+from app.models.agent_models import MultiAgentResult, MultiAgentProcessingStatus
 from app.models.user import NicknameCheckResponse, NicknameLoginRequest, NicknameLoginResponse
 from app.utils.logger import setup_logger, log_function_call
-from datetime import datetime
+from app.utils.video_cache import get_video_cache
 
 # 환경 변수 로드
 load_dotenv()
@@ -28,12 +39,133 @@ load_dotenv()
 # 로거 설정
 logger = setup_logger("main")
 
+
+def _log(level: int, msg: str, **data) -> None:
+    """해당 레벨이 활성일 때만 extra 딕셔너리를 구성해 로깅
+
+    핫패스에서 레벨이 꺼져 있으면(예: 운영 기본 WARNING) 로그용
+    딕셔너리 할당 자체를 생략한다.
+    """
+    if logger.isEnabledFor(level):
+        logger.log(level, msg, extra={"data": data})
+
+# 무거운 서비스(멀티에이전트/DB/요약/사용자)는 임포트 시점이 아닌 앱 기동 시점에
+# 초기화 (워커별 임포트 비용 제거, 생성자들을 동시에 실행해 콜드 스타트 단축)
+multi_agent_service = None
+db_service = None
+summarizer_service = None
+user_service = None
+
+
+def _init_multi_agent_service():
+    """멀티에이전트 서비스 초기화 (실패 시 기능 비활성화)"""
+    try:
+        service = MultiAgentService()
+        logger.info("✅ 멀티에이전트 서비스 초기화 성공")
+        return service
+    except Exception as e:
+        logger.warning("⚠️ 멀티에이전트 서비스 초기화 실패: %s", e)
+        logger.warning("⚠️ 멀티에이전트 기능이 비활성화됩니다")
+        return None
+
+
+def _init_db_service():
+    """데이터베이스 서비스 초기화 (Supabase, 실패 시 메모리 모드)"""
+    try:
+        service = DatabaseService()
+        logger.info("✅ 데이터베이스 서비스 초기화 성공")
+        return service
+    except Exception as e:
+        logger.warning("⚠️ 데이터베이스 서비스 초기화 실패: %s", e)
+        logger.warning("⚠️ DB 없이 계속 실행합니다 (메모리 모드)")
+        return None
+
+
+# DB 저장 요청 큐 - 단일 워커가 순차 소화해 동시 쓰기 폭주를 방지
+_db_write_queue: "asyncio.Queue" = asyncio.Queue()
+
+# 백그라운드 태스크 참조 보관 - 이벤트 루프는 태스크를 약하게만 참조하므로
+# 참조를 잃으면 실행 중인 태스크가 GC로 사라질 수 있음
+_background_tasks: "set[asyncio.Task]" = set()
+
+
+def _spawn_background_task(coro) -> "asyncio.Task":
+    """백그라운드 태스크를 생성하고 완료될 때까지 강한 참조 유지"""
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    return task
+
+
+# 동시에 수신된 동일 영상 요청은 첫 요청의 파이프라인 결과를 공유 (중복 분석 방지)
+_inflight: "dict[str, asyncio.Future]" = {}
+
+# 헬스 응답 스냅샷 - lifespan에서 서비스 상태를 반영해 한 번만 재직렬화
+_HEALTH_BYTES = b'{"status":"healthy","service":"youtube-summarizer"}'
+
+
+def _fail_inflight(future: "asyncio.Future", exc: Exception) -> None:
+    """대기 중인 동일 영상 요청들에게 실패를 전파"""
+    if future is not None and not future.done():
+        future.set_exception(exc)
+        # 대기자가 없어도 'exception was never retrieved' 경고가 남지 않도록 소비
+        future.exception()
+
+
+async def _db_writer():
+    """DB 저장 큐를 드레인하는 백그라운드 워커"""
+    while True:
+        user_id, video_data, final_report, multi_agent_result = await _db_write_queue.get()
+        try:
+            await _persist_multi_agent_report(user_id, video_data, final_report, multi_agent_result)
+        except Exception as e:
+            logger.error("❌ DB 쓰기 워커 오류", extra={"data": {"error": str(e)}})
+        finally:
+            _db_write_queue.task_done()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """앱 기동 시 무거운 서비스들을 워커 스레드에서 병렬 초기화"""
+    global multi_agent_service, db_service, summarizer_service, user_service
+    multi_agent_service, db_service, summarizer_service, user_service = await asyncio.gather(
+        asyncio.to_thread(_init_multi_agent_service),
+        asyncio.to_thread(_init_db_service),
+        asyncio.to_thread(SummarizerService),
+        asyncio.to_thread(UserService),
+    )
+    # 첫 요청이 TLS 핸드셰이크 비용을 내지 않도록 DB 커넥션 예열
+    if db_service is not None:
+        await asyncio.to_thread(db_service.warm_up)
+    db_writer_task = asyncio.create_task(_db_writer())
+
+    # 서비스 구성은 기동 이후 바뀌지 않으므로 헬스 응답을 한 번만 직렬화
+    global _HEALTH_BYTES
+    _HEALTH_BYTES = orjson.dumps({
+        "status": "healthy",
+        "service": "youtube-summarizer",
+        "version": "1.0.0",
+        "services": {
+            "database": "connected" if user_service and db_service else "disconnected",
+            "youtube": "ready" if youtube_service else "not_ready",
+            "ai": "ready" if summarizer_service else "not_ready",
+            "multi_agent": "ready" if multi_agent_service else "not_ready"
+        }
+    })
+    yield
+    # 종료 시 큐에 남은 보고서를 마저 저장한 뒤 워커 중단
+    await _db_write_queue.join()
+    db_writer_task.cancel()
+
+
 # FastAPI 앱 초기화
 logger.info("🚀 FastAPI 앱 초기화 시작")
 app = FastAPI(
-    title="YouTube Summarizer API", 
+    title="YouTube Summarizer API",
     version="1.0.0",
-    description="유튜브 영상을 AI로 요약하는 API 서비스"
+    description="유튜브 영상을 AI로 요약하는 API 서비스",
+    default_response_class=ORJSONResponse,  # 대형 분석 응답 직렬화 가속
+    lifespan=lifespan
 )
 logger.info("✅ FastAPI 앱 초기화 완료")
 
@@ -44,7 +176,7 @@ cors_origins = [
     "http://100.118.223.116:3000",  # Tailscale IP for Android app
     "http://100.118.223.116:8081",  # React Native dev server
 ]
-logger.info(f"📡 CORS 설정 시작", extra={"data": {"allowed_origins": cors_origins}})
+logger.info("📡 CORS 설정 시작", extra={"data": {"allowed_origins": cors_origins}})
 app.add_middleware(
     CORSMiddleware,
     allow_origins=cors_origins,
@@ -54,6 +186,10 @@ app.add_middleware(
 )
 logger.info("✅ CORS 설정 완료")
 
+# 대형 분석 응답(수십 KB JSON)의 전송량을 줄이기 위한 압축 미들웨어
+# (1KB 미만의 헬스체크 등 소형 응답은 압축하지 않음)
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # 서비스 초기화
 logger.info("🔧 서비스 초기화 시작")
 
@@ -63,58 +199,71 @@ try:
     youtube_service = YouTubeServiceYtDlp()
     logger.info("🍪 yt-dlp 서비스 초기화 (쿠키 인증)")
 except Exception as e:
-    logger.warning(f"⚠️ yt-dlp 서비스 초기화 실패, 기본 서비스 사용: {e}")
+    logger.warning("⚠️ yt-dlp 서비스 초기화 실패, 기본 서비스 사용: %s", e)
     youtube_service = YouTubeService()
 
-summarizer_service = SummarizerService()
-user_service = UserService()
+# 요약/사용자 서비스는 lifespan에서 병렬 초기화됨
 
 # FCM 서비스 초기화 (옵셔널 - 실패해도 앱 실행에 영향 없음)
 fcm_service = get_fcm_service()
-if fcm_service.is_available():
+# 사용 가능 여부는 기동 이후 바뀌지 않으므로 한 번만 판정 (핫패스 재조회 방지)
+FCM_AVAILABLE = fcm_service.is_available()
+if FCM_AVAILABLE:
     logger.info("✅ FCM 서비스 사용 가능")
 else:
     logger.info("ℹ️ FCM 서비스 사용 불가 (푸시 알림 비활성화)")
 
-# 멀티에이전트 서비스 초기화
-try:
-    multi_agent_service = MultiAgentService()
-    logger.info("✅ 멀티에이전트 서비스 초기화 성공")
-except Exception as e:
-    logger.warning(f"⚠️ 멀티에이전트 서비스 초기화 실패: {e}")
-    logger.warning("⚠️ 멀티에이전트 기능이 비활성화됩니다")
-    multi_agent_service = None
+# 쿠키 갱신기도 요청마다 get_cookie_refresher()를 호출하지 않도록 모듈 레벨 바인딩
+cookie_refresher = get_cookie_refresher()
 
-# 데이터베이스 서비스 초기화 (Supabase)
-try:
-    db_service = DatabaseService()
-    logger.info("✅ 데이터베이스 서비스 초기화 성공")
-except Exception as e:
-    logger.warning(f"⚠️ 데이터베이스 서비스 초기화 실패: {e}")
-    logger.warning("⚠️ DB 없이 계속 실행합니다 (메모리 모드)")
-    db_service = None
+# 멀티에이전트/데이터베이스 서비스는 lifespan에서 병렬 초기화됨
 
 logger.info("✅ 서비스 초기화 완료")
 
 
+@lru_cache(maxsize=4096)
+def _extract_video_id_cached(url: str) -> str:
+    """동일 URL 재요청 시 비디오 ID 파싱을 생략하기 위한 캐시 래퍼"""
+    return youtube_service.extract_video_id(url)
+
+
+@lru_cache(maxsize=8)
+def _cookie_method_cached(time_bucket: int) -> str:
+    """쿠키 인증 방식 조회를 60초 단위로 메모이즈 (상태 폴링 부하 완화)"""
+    return youtube_service._get_cookie_method_name()
+
+
+# 서비스 타입은 기동 이후 바뀌지 않으므로 한 번만 판정해 상수로 사용
+_IS_YTDLP = isinstance(youtube_service, YouTubeServiceYtDlp)
+_SERVICE_TYPE = "yt-dlp (cookie)" if _IS_YTDLP else "youtube-transcript-api"
+TAILSCALE_IP = "100.118.223.116"
+
+# 루트 응답은 기동 이후 변하지 않으므로 한 번만 직렬화해두고 그대로 반환
+_ROOT_BODY = orjson.dumps({
+    "message": "YouTube Summarizer API",
+    "version": "1.0.0",
+    "docs": "/docs",
+    "service_type": _SERVICE_TYPE,
+    "cookie_auth": _IS_YTDLP,
+    "tailscale_ip": TAILSCALE_IP
+})
+_ROOT_ETAG = f'"{hashlib.md5(_ROOT_BODY).hexdigest()}"'
+
+
 @app.get("/")
-async def root():
+async def root(request: Request):
     """API 루트 엔드포인트"""
     logger.info("📍 루트 엔드포인트 호출")
 
-    # 서비스 타입 확인
-    service_type = "yt-dlp (cookie)" if isinstance(youtube_service, YouTubeServiceYtDlp) else "youtube-transcript-api"
+    # 기동 시 미리 직렬화해둔 바이트를 그대로 반환 (ETag로 304 지원)
+    if request.headers.get("if-none-match") == _ROOT_ETAG:
+        return Response(status_code=304, headers={"ETag": _ROOT_ETAG})
 
-    response = {
-        "message": "YouTube Summarizer API",
-        "version": "1.0.0",
-        "docs": "/docs",
-        "service_type": service_type,
-        "cookie_auth": isinstance(youtube_service, YouTubeServiceYtDlp),
-        "tailscale_ip": "100.118.223.116"
-    }
-    logger.debug("📤 루트 응답", extra={"data": response})
-    return response
+    return Response(
+        content=_ROOT_BODY,
+        media_type="application/json",
+        headers={"ETag": _ROOT_ETAG}
+    )
 
 
 @app.get("/api/auth/cookie/status")
@@ -123,8 +272,8 @@ async def get_cookie_status():
     logger.info("🍪 쿠키 상태 확인 요청")
 
     try:
-        if isinstance(youtube_service, YouTubeServiceYtDlp):
-            cookie_method = youtube_service._get_cookie_method_name()
+        if _IS_YTDLP:
+            cookie_method = _cookie_method_cached(int(time.time() // 60))
             return {
                 "status": "active",
                 "method": cookie_method,
@@ -144,10 +293,125 @@ async def get_cookie_status():
                 "can_access_membership": False
             }
     except Exception as e:
-        logger.error(f"❌ 쿠키 상태 조회 실패", extra={"data": {"error": str(e)}})
+        logger.error("❌ 쿠키 상태 조회 실패", extra={"data": {"error": str(e)}})
         raise HTTPException(status_code=500, detail=str(e))
 
 
+async def _persist_multi_agent_report(user_id, video_data, final_report, multi_agent_result):
+    """멀티에이전트 분석 결과를 백그라운드에서 DB에 저장 (실패는 로그만 남김)"""
+    try:
+        logger.info("🔄 멀티에이전트 보고서 저장 시작", extra={"data": {
+            "user_id": user_id,
+            "video_id": video_data.video_id,
+            "title": video_data.title
+        }})
+
+        # 멀티에이전트 결과를 DB에 저장
+        report_id = await db_service.save_multi_agent_report(
+            user_id=user_id,
+            video_id=video_data.video_id,
+            title=video_data.title,
+            channel=video_data.channel,
+            duration=video_data.duration,
+            language=video_data.language,
+            final_report=final_report,
+            agent_results={
+                "transcript_refinement": multi_agent_result.transcript_refinement,
+                "speaker_diarization": multi_agent_result.speaker_diarization,
+                "topic_cohesion": multi_agent_result.topic_cohesion,
+                "structure_design": multi_agent_result.structure_design,
+                "report_synthesis": multi_agent_result.report_synthesis
+            },
+            processing_status={
+                "status": multi_agent_result.processing_status.status,
+                "total_processing_time": multi_agent_result.processing_status.total_processing_time,
+                "successful_agents": multi_agent_result.successful_agents,
+                "total_agents": multi_agent_result.total_agents
+            }
+        )
+
+        if report_id:
+            logger.info("✅ 멀티에이전트 결과 DB 저장 완료", extra={"data": {
+                "report_id": report_id,
+                "video_id": video_data.video_id
+            }})
+        else:
+            logger.warning("⚠️ 멀티에이전트 결과 DB 저장 실패")
+    except Exception as e:
+        logger.error("❌ DB 저장 중 오류", extra={"data": {
+            "error": str(e),
+            "error_type": type(e).__name__,
+            "user_id": user_id,
+            "video_id": video_data.video_id,
+            "has_agent_results": multi_agent_result.successful_agents > 0,
+            "processing_status": multi_agent_result.processing_status.status
+        }})
+
+
+def _report_row_to_result(report: dict) -> Optional[MultiAgentResult]:
+    """
+    DB에 저장된 보고서 레코드를 MultiAgentResult로 복원
+
+    완료(completed) 상태의 보고서만 재사용 대상으로 변환하며,
+    그 외(부분 실패 등)는 None을 반환해 재분석을 유도
+
+    Args:
+        report: analysis_reports 테이블 레코드
+
+    Returns:
+        복원된 MultiAgentResult 또는 None
+    """
+    stored = report.get("analysis_result") or {}
+    stored_agents = stored.get("agent_results") or {}
+    stored_status = stored.get("processing_status") or {}
+
+    if stored_status.get("status") != "completed":
+        return None
+
+    # 런타임에서 에이전트 결과는 dict 그대로 다루므로 재검증 없이 복원
+    return MultiAgentResult.model_construct(
+        transcript_refinement=stored_agents.get("transcript_refinement"),
+        speaker_diarization=stored_agents.get("speaker_diarization"),
+        topic_cohesion=stored_agents.get("topic_cohesion"),
+        structure_design=stored_agents.get("structure_design"),
+        report_synthesis=stored_agents.get("report_synthesis"),
+        processing_status=MultiAgentProcessingStatus(
+            status="completed",
+            total_processing_time=stored_status.get("total_processing_time")
+        ),
+        total_agents=stored_status.get("total_agents", 5),
+        successful_agents=stored_status.get("successful_agents", 0)
+    )
+
+
+async def _send_fcm_notification(fcm_token: str, video_title: str, video_id: str):
+    """분석 완료 FCM 푸시 알림을 백그라운드에서 전송 (실패는 로그만 남김)"""
+    try:
+        logger.info("📱 FCM 푸시 알림 전송 시도", extra={"data": {
+            "fcm_token": fcm_token[:30] + "..." if len(fcm_token) > 30 else fcm_token,
+            "video_title": video_title,
+            "video_id": video_id
+        }})
+
+        result = await fcm_service.send_analysis_complete_notification(
+            fcm_token=fcm_token,
+            video_title=video_title,
+            video_id=video_id
+        )
+
+        logger.info("📱 FCM 전송 결과", extra={"data": {
+            "success": result,
+            "fcm_token_used": fcm_token[:20] + "..."
+        }})
+    except Exception as fcm_error:
+        # FCM 전송 실패해도 분석 결과는 정상 반환
+        logger.warning("⚠️ FCM 전송 실패 (무시하고 계속)", extra={"data": {
+            "error": str(fcm_error),
+            "error_type": type(fcm_error).__name__,
+            "fcm_token_tried": fcm_token[:20] + "..."
+        }})
+
+
 @app.post("/api/summarize", response_model=MultiAgentAnalyzeResponse)
 async def summarize_video(request: SummarizeRequest):
     """
@@ -164,21 +428,21 @@ async def summarize_video(request: SummarizeRequest):
         500: 서버 내부 오류
         503: 멀티에이전트 서비스 사용 불가
     """
-    # 요청 정보 상세 로깅 (FCM 토큰 포함)
+    # 요청 수신 로깅 (INFO에서는 핵심 필드만, 전체 덤프는 DEBUG에서만)
     fcm_token = request.fcm_token  # 직접 접근
-    logger.info("📥 고급 분석 요청 수신", extra={"data": {
-        "url": request.url,
-        "user_id": request.user_id,
-        "user_id_type": type(request.user_id).__name__,
-        "has_fcm_token": bool(fcm_token),
-        "fcm_token_preview": fcm_token[:20] + "..." if fcm_token else None,
-        "fcm_token_length": len(fcm_token) if fcm_token else 0,
-        "request_fields": list(request.__dict__.keys()),
-        "request_data": request.model_dump(),  # 전체 요청 데이터
-        "endpoint": "/api/summarize",
-        "client_ip": "unknown",  # FastAPI에서 클라이언트 IP 가져오려면 별도 로직 필요
-        "timestamp": datetime.now().isoformat()
-    }})
+    _log(logging.INFO, "📥 고급 분석 요청 수신",
+         url=request.url,
+         user_id=request.user_id,
+         has_fcm_token=bool(fcm_token))
+    if logger.isEnabledFor(logging.DEBUG):
+        # model_dump는 모든 필드를 순회하며 dict를 새로 할당하므로 DEBUG에서만 수행
+        logger.debug("📥 요청 상세", extra={"data": {
+            "user_id_type": type(request.user_id).__name__,
+            "fcm_token_preview": fcm_token[:20] + "..." if fcm_token else None,
+            "fcm_token_length": len(fcm_token) if fcm_token else 0,
+            "request_data": request.model_dump(),
+            "endpoint": "/api/summarize"
+        }})
     # 멀티에이전트 서비스 사용 가능 여부 확인
     if multi_agent_service is None:
         logger.error("❌ 멀티에이전트 서비스 사용 불가")
@@ -187,63 +451,105 @@ async def summarize_video(request: SummarizeRequest):
             detail="멀티에이전트 분석 서비스를 사용할 수 없습니다. 관리자에게 문의하세요."
         )
     
-    start_time = asyncio.get_event_loop().time()
-    
+    start_time = time.perf_counter()
+    inflight_future = None
+    video_id = None
+
     try:
-        # 요청 데이터 로깅 (전문)
-        logger.info("📥 고급 분석 요청 수신", extra={"data": {
-            "url": request.url,
-            "endpoint": "/api/summarize"
-        }})
-        
-        # 0. 비디오 ID 추출 (캐시 확인용)
-        video_id = youtube_service.extract_video_id(request.url)
-        logger.info(f"🔍 비디오 ID 추출: {video_id}")
-        
-        # 1. DB에서 멀티에이전트 캐시된 데이터 확인 (추후 구현)
-        # TODO: 멀티에이전트 전용 캐시 테이블 구현 필요
-        
-        # 2. 유튜브 영상 정보 및 자막 추출
-        logger.info(f"🎬 유튜브 데이터 추출 시작: {request.url}")
-        video_data = await youtube_service.get_video_data(request.url)
-        
-        # 비디오 데이터 로깅 (전문)
-        logger.debug("📊 비디오 데이터 추출 완료", extra={"data": {
-            "video_id": video_data.video_id,
-            "title": video_data.title,
-            "channel": video_data.channel,
-            "duration": video_data.duration,
-            "language": video_data.language,
-            "transcript_length": len(video_data.transcript) if video_data.transcript else 0
-        }})
-        
+        # 0. 비디오 ID 추출 (캐시 확인용, 동일 URL 재요청은 파싱 생략)
+        video_id = _extract_video_id_cached(request.url)
+        logger.info("🔍 비디오 ID 추출: %s", video_id)
+
+        # 같은 영상이 이미 분석 중이면 파이프라인을 새로 돌리지 않고 결과 공유
+        # (force_refresh 요청은 재분석이 목적이므로 대기하지 않음)
+        existing = _inflight.get(video_id)
+        if existing is not None and not request.force_refresh:
+            _log(logging.INFO, "🔁 동일 영상 분석 진행 중 - 기존 작업 결과 대기",
+                 video_id=video_id)
+            # 대기자가 연결을 끊어도 원 작업이 취소되지 않도록 shield
+            return await asyncio.shield(existing)
+
+        inflight_future = asyncio.get_running_loop().create_future()
+        _inflight[video_id] = inflight_future
+
+        video_cache = get_video_cache()
+
+        # 1. 캐시된 영상 데이터 확인 (동일 영상 재요청은 yt-dlp/자막 다운로드 생략)
+        video_data = video_cache.get(f"video:{video_id}")
+        if video_data is not None:
+            _log(logging.INFO, "💾 캐시된 영상 데이터 사용", video_id=video_id)
+        else:
+            # 2. 유튜브 영상 정보 및 자막 추출
+            logger.info("🎬 유튜브 데이터 추출 시작: %s", request.url)
+            video_data = await youtube_service.get_video_data(request.url)
+
+            # 비디오 데이터 로깅 (전문, DEBUG 비활성 시 딕셔너리 구성 비용 생략)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("📊 비디오 데이터 추출 완료", extra={"data": {
+                    "video_id": video_data.video_id,
+                    "title": video_data.title,
+                    "channel": video_data.channel,
+                    "duration": video_data.duration,
+                    "language": video_data.language,
+                    "transcript_length": len(video_data.transcript) if video_data.transcript else 0
+                }})
+
+            # 자막이 있는 영상만 캐시 (실패 응답은 재시도 가능하게 유지)
+            if video_data.transcript:
+                video_cache.set(f"video:{video_id}", video_data)
+
         # 자막이 없는 경우 에러 처리
         if not video_data.transcript:
-            logger.warning("⚠️ 자막 없음", extra={"data": {"video_id": video_data.video_id}})
+            _log(logging.WARNING, "⚠️ 자막 없음", video_id=video_data.video_id)
             raise HTTPException(
                 status_code=400,
                 detail="자막을 찾을 수 없습니다. 다른 영상을 시도해주세요."
             )
+
+        # 3. 멀티에이전트 시스템으로 고급 분석 수행 (완료된 결과는 재사용)
+        analysis_cache_key = f"analysis:{video_id}:{video_data.language}"
+        multi_agent_result = None if request.force_refresh \
+            else video_cache.get(analysis_cache_key)
+        if multi_agent_result is not None:
+            _log(logging.INFO, "💾 캐시된 분석 결과 사용", video_id=video_id)
+        else:
+            # 메모리 캐시 미스 시 DB에 저장된 완료 보고서 확인
+            # (서버 재시작 후에도 동일 영상 재분석을 DB 왕복 한 번으로 대체)
+            if db_service is not None and not request.force_refresh:
+                cached_report = await db_service.get_latest_report_by_video(
+                    video_id, video_data.language
+                )
+                if cached_report:
+                    multi_agent_result = _report_row_to_result(cached_report)
+                    if multi_agent_result is not None:
+                        _log(logging.INFO, "💾 DB에 저장된 보고서 재사용",
+                             video_id=video_id,
+                             report_id=cached_report.get("id"))
+                        video_cache.set(analysis_cache_key, multi_agent_result, ttl=86400)
+
+        if multi_agent_result is None:
+            logger.info("🎭 멀티에이전트 분석 시작")
+            multi_agent_result = await multi_agent_service.process_full_analysis(
+                transcript=video_data.transcript,
+                title=video_data.title,
+                video_id=video_data.video_id,
+                language=video_data.language
+            )
+            # 전체 파이프라인이 성공한 결과만 캐시 (부분 실패는 재분석 대상)
+            if multi_agent_result.processing_status.status == "completed":
+                video_cache.set(analysis_cache_key, multi_agent_result, ttl=86400)
         
-        # 3. 멀티에이전트 시스템으로 고급 분석 수행
-        logger.info(f"🎭 멀티에이전트 분석 시작")
-        multi_agent_result = await multi_agent_service.process_full_analysis(
-            transcript=video_data.transcript,
-            title=video_data.title,
-            video_id=video_data.video_id,
-            language=video_data.language
-        )
-        
-        # 분석 결과 로깅
-        logger.debug("🎯 멀티에이전트 분석 완료", extra={"data": {
-            "status": multi_agent_result.processing_status.status,
-            "successful_agents": multi_agent_result.successful_agents,
-            "total_agents": multi_agent_result.total_agents,
-            "processing_time": multi_agent_result.processing_status.total_processing_time
-        }})
+        # 분석 결과 로깅 (DEBUG 비활성 시 딕셔너리 구성 비용 생략)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("🎯 멀티에이전트 분석 완료", extra={"data": {
+                "status": multi_agent_result.processing_status.status,
+                "successful_agents": multi_agent_result.successful_agents,
+                "total_agents": multi_agent_result.total_agents,
+                "processing_time": multi_agent_result.processing_status.total_processing_time
+            }})
         
         # 4. 응답 생성
-        processing_time = asyncio.get_event_loop().time() - start_time
+        processing_time = time.perf_counter() - start_time
         
         # 최종 보고서 추출
         final_report = None
@@ -251,13 +557,16 @@ async def summarize_video(request: SummarizeRequest):
             hasattr(multi_agent_result.report_synthesis, 'get')):
             final_report = multi_agent_result.report_synthesis.get("final_report")
         
-        response = MultiAgentAnalyzeResponse(
+        # 분석 결과는 dict로 복제하지 않고 Pydantic 모델 그대로 전달
+        # (응답 직렬화 시점에 ORJSONResponse가 한 번만 변환 - 피크 메모리 절감)
+        # 모든 필드를 직접 구성했으므로 model_construct로 재검증 생략
+        response = MultiAgentAnalyzeResponse.model_construct(
             video_id=video_data.video_id,
             title=video_data.title,
             channel=video_data.channel,
             duration=video_data.duration,
             language=video_data.language,
-            analysis_result=multi_agent_result.model_dump(),
+            analysis_result=multi_agent_result,
             final_report=final_report,
             transcript_available=True,
             analysis_type="multi_agent",
@@ -265,233 +574,438 @@ async def summarize_video(request: SummarizeRequest):
         )
         
         # 5. DB에 저장 (백그라운드) - 멀티에이전트 결과용
-        logger.info("🗄️ DB 저장 시도", extra={"data": {
-            "has_db_service": db_service is not None,
-            "user_id": request.user_id,
-            "user_id_type": type(request.user_id).__name__,
-            "user_id_length": len(request.user_id) if request.user_id else 0,
-            "user_id_is_none": request.user_id is None,
-            "user_id_is_empty": request.user_id == "" if request.user_id else True
-        }})
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("🗄️ DB 저장 시도", extra={"data": {
+                "has_db_service": db_service is not None,
+                "user_id": request.user_id,
+                "user_id_type": type(request.user_id).__name__,
+                "user_id_length": len(request.user_id) if request.user_id else 0
+            }})
 
         if db_service and request.user_id and request.user_id.strip():  # 빈 문자열도 체크
-            try:
-                logger.info("🔄 멀티에이전트 보고서 저장 시작", extra={"data": {
-                    "user_id": request.user_id,
-                    "video_id": video_data.video_id,
-                    "title": video_data.title
-                }})
-
-                # 멀티에이전트 결과를 DB에 저장
-                report_id = await db_service.save_multi_agent_report(
-                    user_id=request.user_id,
-                    video_id=video_data.video_id,
-                    title=video_data.title,
-                    channel=video_data.channel,
-                    duration=video_data.duration,
-                    language=video_data.language,
-                    final_report=final_report,
-                    agent_results={
-                        "transcript_refinement": multi_agent_result.transcript_refinement,
-                        "speaker_diarization": multi_agent_result.speaker_diarization,
-                        "topic_cohesion": multi_agent_result.topic_cohesion,
-                        "structure_design": multi_agent_result.structure_design,
-                        "report_synthesis": multi_agent_result.report_synthesis
-                    },
-                    processing_status={
-                        "status": multi_agent_result.processing_status.status,
-                        "total_processing_time": multi_agent_result.processing_status.total_processing_time,
-                        "successful_agents": multi_agent_result.successful_agents,
-                        "total_agents": multi_agent_result.total_agents
-                    }
-                )
-
-                if report_id:
-                    logger.info(f"✅ 멀티에이전트 결과 DB 저장 완료", extra={"data": {
-                        "report_id": report_id,
-                        "video_id": video_data.video_id
-                    }})
-                else:
-                    logger.warning("⚠️ 멀티에이전트 결과 DB 저장 실패")
-            except Exception as e:
-                logger.error(f"❌ DB 저장 중 오류", extra={"data": {
-                    "error": str(e),
-                    "error_type": type(e).__name__,
-                    "user_id": request.user_id,
-                    "video_id": video_data.video_id,
-                    "has_agent_results": len(multi_agent_result.model_dump()) > 0,
-                    "processing_status": multi_agent_result.processing_status.status
-                }})
+            # 응답 반환을 DB 라운드트립으로 지연시키지 않도록 쓰기 큐에 적재
+            # (단일 워커가 순차 처리 - 부하 시에도 동시 삽입 폭주 없음)
+            _db_write_queue.put_nowait(
+                (request.user_id, video_data, final_report, multi_agent_result)
+            )
         else:
-            logger.info("⏭️ DB 저장 건너뜀", extra={"data": {
-                "reason": "no_db_service" if not db_service else "no_user_id",
-                "has_db_service": db_service is not None,
-                "user_id_provided": request.user_id is not None,
-                "user_id_value": request.user_id if request.user_id else "None"
-            }})
+            _log(logging.INFO, "⏭️ DB 저장 건너뜀",
+                 reason="no_db_service" if not db_service else "no_user_id",
+                 has_db_service=db_service is not None,
+                 user_id_provided=request.user_id is not None)
 
-        logger.info(f"✅ 고급 분석 완료: {video_data.video_id}", extra={"data": {
-            "processing_time": f"{processing_time:.2f}초",
-            "status": multi_agent_result.processing_status.status,
-            "successful_agents": multi_agent_result.successful_agents
-        }})
+        _log(logging.INFO, "✅ 고급 분석 완료",
+             video_id=video_data.video_id,
+             processing_time=f"{processing_time:.2f}초",
+             status=multi_agent_result.processing_status.status,
+             successful_agents=multi_agent_result.successful_agents)
 
         # FCM 푸시 알림 전송 (옵셔널 - 실패해도 응답에 영향 없음)
+        # 응답 반환과 독립적인 부수 효과이므로 대기하지 않고 태스크로 발사
         fcm_token = request.fcm_token  # getattr 대신 직접 접근
-        logger.info("🔍 FCM 토큰 확인", extra={"data": {
-            "has_fcm_token": bool(fcm_token),
-            "fcm_token_preview": fcm_token[:20] + "..." if fcm_token else None,
-            "fcm_token_length": len(fcm_token) if fcm_token else 0,
-            "fcm_service_available": fcm_service.is_available(),
-            "fcm_token_full": fcm_token  # 디버깅용 전체 토큰
-        }})
-
         if fcm_token:
-            try:
-                logger.info("📱 FCM 푸시 알림 전송 시도", extra={"data": {
-                    "fcm_token": fcm_token[:30] + "..." if len(fcm_token) > 30 else fcm_token,
-                    "video_title": video_data.title,
-                    "video_id": video_data.video_id
-                }})
-
-                result = await fcm_service.send_analysis_complete_notification(
-                    fcm_token=fcm_token,
-                    video_title=video_data.title,
-                    video_id=video_data.video_id
-                )
-
-                logger.info("📱 FCM 전송 결과", extra={"data": {
-                    "success": result,
-                    "fcm_token_used": fcm_token[:20] + "..."
-                }})
-            except Exception as fcm_error:
-                # FCM 전송 실패해도 분석 결과는 정상 반환
-                logger.warning("⚠️ FCM 전송 실패 (무시하고 계속)", extra={"data": {
-                    "error": str(fcm_error),
-                    "error_type": type(fcm_error).__name__,
-                    "fcm_token_tried": fcm_token[:20] + "..."
-                }})
+            _spawn_background_task(
+                _send_fcm_notification(fcm_token, video_data.title, video_data.video_id)
+            )
         else:
-            logger.info("🔕 FCM 전송 건너뜀", extra={"data": {
-                "reason": "no_fcm_token",
-                "request_fields": list(request.__dict__.keys())
-            }})
+            _log(logging.INFO, "🔕 FCM 전송 건너뜀", reason="no_fcm_token")
+
+        # 핸들러가 이미 검증된 모델을 만들었으므로 response_model 재검증을 생략하고
+        # 직접 직렬화해 반환 (대형 트리 덤프는 워커 스레드에서 수행)
+        payload = await asyncio.to_thread(response.model_dump, mode="json")
+        final_response = ORJSONResponse(payload)
+        if not inflight_future.done():
+            inflight_future.set_result(final_response)
+        return final_response
 
-        return response
-        
     except HTTPException as e:
-        logger.error(f"❌ HTTP 예외 발생", extra={"data": {"status": e.status_code, "detail": e.detail}})
+        logger.error("❌ HTTP 예외 발생", extra={"data": {"status": e.status_code, "detail": e.detail}})
+        _fail_inflight(inflight_future, e)
         raise
     except ValueError as e:
-        logger.error(f"❌ 값 오류 발생", extra={"data": str(e)})
-        raise HTTPException(status_code=400, detail=str(e))
+        logger.error("❌ 값 오류 발생", extra={"data": str(e)})
+        exc = HTTPException(status_code=400, detail=str(e))
+        _fail_inflight(inflight_future, exc)
+        raise exc
     except Exception as e:
-        processing_time = asyncio.get_event_loop().time() - start_time
-        logger.error(f"❌ 예상치 못한 오류", extra={"data": {
+        processing_time = time.perf_counter() - start_time
+        logger.error("❌ 예상치 못한 오류", extra={"data": {
             "error": str(e),
             "error_type": type(e).__name__,
             "elapsed_time": f"{processing_time:.2f}초"
         }})
-        raise HTTPException(
-            status_code=500, 
+        exc = HTTPException(
+            status_code=500,
             detail=f"고급 분석 중 오류가 발생했습니다: {str(e)}"
         )
+        _fail_inflight(inflight_future, exc)
+        raise exc
+    finally:
+        if inflight_future is not None:
+            # 취소 등 BaseException으로 빠져나가는 경로에서도 대기자들이
+            # 영구 대기하지 않도록 미해결 future는 반드시 실패 처리
+            if not inflight_future.done():
+                _fail_inflight(inflight_future, HTTPException(
+                    status_code=503,
+                    detail="분석 작업이 중단되었습니다. 다시 시도해주세요."
+                ))
+            # force_refresh 요청이 슬롯을 덮어쓴 경우 남의 future를 지우지
+            # 않도록 자신이 등록한 future일 때만 제거
+            if _inflight.get(video_id) is inflight_future:
+                del _inflight[video_id]
+
+
+@app.post("/api/summarize/stream")
+async def summarize_video_stream(request: SummarizeRequest):
+    """
+    멀티에이전트 분석 결과를 SSE(Server-Sent Events)로 스트리밍합니다.
 
+    각 에이전트가 완료될 때마다 부분 결과를 data 프레임으로 전송하고,
+    마지막에 전체 응답을 "event: done" 프레임으로 전송합니다.
+    클라이언트는 전체 파이프라인(10~60초)을 기다리지 않고
+    정제된 자막/주제 클러스터를 생성되는 즉시 표시할 수 있습니다.
 
+    Args:
+        request: 유튜브 URL이 포함된 요청 객체
 
-@app.get("/api/health")
-async def health_check():
+    Returns:
+        StreamingResponse: text/event-stream 형식의 단계별 분석 결과
     """
-    서버 상태 확인 엔드포인트
+    if multi_agent_service is None:
+        logger.error("❌ 멀티에이전트 서비스 사용 불가")
+        raise HTTPException(
+            status_code=503,
+            detail="멀티에이전트 분석 서비스를 사용할 수 없습니다. 관리자에게 문의하세요."
+        )
 
-    Returns:
-        dict: 서버 상태 정보
+    # 영상 데이터는 스트리밍 시작 전에 확보 (URL/자막 오류는 일반 HTTP 에러로 반환)
+    video_id = _extract_video_id_cached(request.url)
+    video_cache = get_video_cache()
+
+    video_data = video_cache.get(f"video:{video_id}")
+    if video_data is None:
+        logger.info("🎬 유튜브 데이터 추출 시작: %s", request.url)
+        video_data = await youtube_service.get_video_data(request.url)
+        if video_data.transcript:
+            video_cache.set(f"video:{video_id}", video_data)
+
+    if not video_data.transcript:
+        logger.warning("⚠️ 자막 없음", extra={"data": {"video_id": video_data.video_id}})
+        raise HTTPException(
+            status_code=400,
+            detail="자막을 찾을 수 없습니다. 다른 영상을 시도해주세요."
+        )
+
+    start_time = time.perf_counter()
+    analysis_cache_key = f"analysis:{video_id}:{video_data.language}"
+
+    async def _event_stream():
+        """에이전트 단위 부분 결과를 SSE 프레임으로 변환하는 제너레이터"""
+        final_result = None if request.force_refresh \
+            else video_cache.get(analysis_cache_key)
+        if final_result is not None:
+            logger.info("💾 캐시된 분석 결과 스트리밍", extra={"data": {"video_id": video_id}})
+        else:
+            async for agent_name, partial in multi_agent_service.stream_full_analysis(
+                transcript=video_data.transcript,
+                title=video_data.title,
+                video_id=video_data.video_id,
+                language=video_data.language
+            ):
+                if agent_name == "result":
+                    final_result = partial
+                    continue
+                # 프레임 단위가 에이전트(수 초 간격)라 별도 코얼레싱 타이머는 불필요
+                yield b"data: " + orjson.dumps({"agent": agent_name, "result": partial}) + b"\n\n"
+
+            # 완료된 분석은 단일 응답 경로와 동일하게 캐시 적재
+            if final_result.processing_status.status == "completed":
+                video_cache.set(analysis_cache_key, final_result, ttl=86400)
+
+        final_report = None
+        if (final_result.report_synthesis and
+            hasattr(final_result.report_synthesis, 'get')):
+            final_report = final_result.report_synthesis.get("final_report")
+
+        # 동기 엔드포인트와 동일한 후처리 (DB 저장 큐 적재 + FCM 알림)
+        if db_service and request.user_id and request.user_id.strip():
+            _db_write_queue.put_nowait(
+                (request.user_id, video_data, final_report, final_result)
+            )
+        if request.fcm_token:
+            _spawn_background_task(
+                _send_fcm_notification(
+                    request.fcm_token, video_data.title, video_data.video_id
+                )
+            )
+
+        response = MultiAgentAnalyzeResponse.model_construct(
+            video_id=video_data.video_id,
+            title=video_data.title,
+            channel=video_data.channel,
+            duration=video_data.duration,
+            language=video_data.language,
+            analysis_result=final_result,
+            final_report=final_report,
+            transcript_available=True,
+            analysis_type="multi_agent",
+            processing_time=time.perf_counter() - start_time
+        )
+        payload = await asyncio.to_thread(response.model_dump, mode="json")
+        yield b"event: done\ndata: " + orjson.dumps(payload) + b"\n\n"
+
+    return StreamingResponse(_event_stream(), media_type="text/event-stream")
+
+
+# 비동기 잡 저장소 - 외부 브로커 없이 인프로세스 태스크로 분석 작업을 추적
+# (잡 레코드: status/progress/video_id/result/error/created_at/finished_at)
+_jobs: "dict[str, dict]" = {}
+_JOB_TTL = int(os.getenv("SUMMARIZE_JOB_TTL", "3600"))
+
+
+def _prune_jobs() -> None:
+    """TTL이 지난 잡 레코드 정리 (새 잡 등록 시점에 수행)
+
+    실행 중인 잡을 중간에 지우면 폴링 클라이언트가 404를 받고 결과가
+    유실되므로, 종료 상태(completed/failed)의 잡만 완료 시각 기준으로
+    정리한다.
     """
-    logger.info("🏥 헬스체크 요청 수신")
+    now = time.time()
+    expired = [job_id for job_id, job in _jobs.items()
+               if job["status"] in ("completed", "failed")
+               and now - job["finished_at"] > _JOB_TTL]
+    for job_id in expired:
+        del _jobs[job_id]
+
+
+async def _run_summarize_job(job_id: str, request: SummarizeRequest):
+    """
+    큐에 등록된 분석 잡 실행 (HTTP 워커와 분리된 백그라운드 태스크)
+
+    진행 상황을 잡 레코드에 기록하고, 완료 시 DB 저장 큐 적재와
+    FCM 알림까지 동기 엔드포인트와 동일하게 수행
+    """
+    job = _jobs[job_id]
+    job["status"] = "processing"
 
     try:
-        # 각 서비스 상태 체크
-        db_status = "connected" if user_service and db_service else "disconnected"
-        yt_status = "ready" if youtube_service else "not_ready"
-        ai_status = "ready" if summarizer_service else "not_ready"
-        multi_agent_status = "ready" if multi_agent_service else "not_ready"
-
-        health_data = {
-            "status": "healthy",
-            "version": "1.0.0",
-            "timestamp": datetime.now().isoformat(),
-            "services": {
-                "database": db_status,
-                "youtube": yt_status,
-                "ai": ai_status,
-                "multi_agent": multi_agent_status
-            }
-        }
+        video_id = _extract_video_id_cached(request.url)
+        job["video_id"] = video_id
+        video_cache = get_video_cache()
 
-        logger.info("✅ 헬스체크 성공", extra={"data": health_data})
+        video_data = video_cache.get(f"video:{video_id}")
+        if video_data is None:
+            logger.info("🎬 유튜브 데이터 추출 시작: %s", request.url)
+            video_data = await youtube_service.get_video_data(request.url)
+            if video_data.transcript:
+                video_cache.set(f"video:{video_id}", video_data)
 
-        return health_data
+        if not video_data.transcript:
+            raise ValueError("자막을 찾을 수 없습니다. 다른 영상을 시도해주세요.")
+
+        analysis_cache_key = f"analysis:{video_id}:{video_data.language}"
+        multi_agent_result = None if request.force_refresh \
+            else video_cache.get(analysis_cache_key)
+
+        if multi_agent_result is None:
+            start_time = time.perf_counter()
+            completed = 0
+            async for agent_name, partial in multi_agent_service.stream_full_analysis(
+                transcript=video_data.transcript,
+                title=video_data.title,
+                video_id=video_data.video_id,
+                language=video_data.language
+            ):
+                if agent_name == "result":
+                    multi_agent_result = partial
+                else:
+                    completed += 1
+                    job["progress"] = {
+                        "completed": completed,
+                        "total": len(multi_agent_service.agent_pipeline),
+                        "last_agent": agent_name
+                    }
+
+            if multi_agent_result.processing_status.status != "completed":
+                raise RuntimeError(
+                    multi_agent_result.processing_status.error_message or "분석 실패"
+                )
+            video_cache.set(analysis_cache_key, multi_agent_result, ttl=86400)
+            logger.info("✅ 잡 분석 완료: %s (%.2f초)",
+                        job_id, time.perf_counter() - start_time)
+
+        final_report = None
+        if (multi_agent_result.report_synthesis and
+            hasattr(multi_agent_result.report_synthesis, 'get')):
+            final_report = multi_agent_result.report_synthesis.get("final_report")
+
+        response = MultiAgentAnalyzeResponse.model_construct(
+            video_id=video_data.video_id,
+            title=video_data.title,
+            channel=video_data.channel,
+            duration=video_data.duration,
+            language=video_data.language,
+            analysis_result=multi_agent_result,
+            final_report=final_report,
+            transcript_available=True,
+            analysis_type="multi_agent",
+            processing_time=multi_agent_result.processing_status.total_processing_time
+        )
+        job["result"] = await asyncio.to_thread(response.model_dump, mode="json")
+        job["status"] = "completed"
+        job["finished_at"] = time.time()
+
+        # 동기 엔드포인트와 동일한 후처리 (DB 저장 큐 적재 + FCM 알림)
+        if db_service and request.user_id and request.user_id.strip():
+            _db_write_queue.put_nowait(
+                (request.user_id, video_data, final_report, multi_agent_result)
+            )
+        if request.fcm_token:
+            await _send_fcm_notification(
+                request.fcm_token, video_data.title, video_data.video_id
+            )
 
     except Exception as e:
-        error_data = {
-            "status": "unhealthy",
+        job["status"] = "failed"
+        job["error"] = str(e)
+        job["finished_at"] = time.time()
+        logger.error("❌ 분석 잡 실패", extra={"data": {
+            "job_id": job_id,
             "error": str(e),
-            "timestamp": datetime.now().isoformat()
-        }
-        logger.error("❌ 헬스체크 실패", extra={"data": error_data})
+            "error_type": type(e).__name__
+        }})
+
+
+@app.post("/api/summarize/jobs")
+async def enqueue_summarize_job(request: SummarizeRequest):
+    """
+    분석 작업을 큐에 등록하고 잡 ID를 즉시 반환합니다.
+
+    파이프라인(10~60초)이 HTTP 워커를 점유하지 않도록 백그라운드
+    태스크로 실행하며, 클라이언트는 잡 ID로 진행 상황을 조회하거나
+    FCM 토큰을 제공한 경우 폴링 없이 완료 알림을 받을 수 있습니다.
+
+    Args:
+        request: 유튜브 URL이 포함된 요청 객체
 
-        from fastapi.responses import JSONResponse
-        return JSONResponse(
+    Returns:
+        dict: 잡 ID와 초기 상태 (queued)
+    """
+    if multi_agent_service is None:
+        raise HTTPException(
             status_code=503,
-            content=error_data
+            detail="멀티에이전트 분석 서비스를 사용할 수 없습니다. 관리자에게 문의하세요."
         )
 
+    _prune_jobs()
+
+    job_id = uuid.uuid4().hex
+    _jobs[job_id] = {
+        "status": "queued",
+        "progress": None,
+        "video_id": None,
+        "result": None,
+        "error": None,
+        "created_at": time.time(),
+        "finished_at": None
+    }
+    _spawn_background_task(_run_summarize_job(job_id, request))
+
+    logger.info("📬 분석 잡 등록", extra={"data": {"job_id": job_id, "url": request.url}})
+    return {"job_id": job_id, "status": "queued"}
+
+
+@app.get("/api/summarize/jobs/{job_id}")
+async def get_summarize_job(job_id: str):
+    """
+    등록된 분석 잡의 상태/진행 상황/결과를 조회합니다.
+
+    Args:
+        job_id: 잡 등록 시 반환된 ID
+
+    Returns:
+        dict: 상태(queued/processing/completed/failed), 진행 상황, 결과
+    """
+    job = _jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="잡을 찾을 수 없습니다.")
+
+    return {
+        "job_id": job_id,
+        "status": job["status"],
+        "progress": job["progress"],
+        "video_id": job["video_id"],
+        "result": job["result"],
+        "error": job["error"]
+    }
+
+
+@app.get("/health")
+@app.get("/api/health")
+async def health_check():
+    """
+    서버 상태 확인 엔드포인트 (/health, /api/health 공용)
+
+    서비스 구성은 기동 이후 바뀌지 않으므로 lifespan에서 만든
+    사전 직렬화 스냅샷을 그대로 반환 (요청당 딕셔너리 구성 없음)
+
+    Returns:
+        Response: 서버/서비스 상태 스냅샷
+    """
+    return Response(content=_HEALTH_BYTES, media_type="application/json")
+
 
 @app.get("/api/auth/check/{nickname}")
-async def check_nickname(nickname: str):
+def check_nickname(nickname: str):
     """
     닉네임 중복 확인 (대소문자 무시)
-    
+
+    동기 Supabase 호출만 수행하므로 def 라우트로 선언해
+    FastAPI가 스레드풀에서 실행하도록 함 (이벤트 루프 비블로킹)
+
     Args:
         nickname: 확인할 닉네임
-    
+
     Returns:
         중복 여부와 메시지
     """
-    logger.info(f"📥 닉네임 중복 확인 요청: {nickname}")
-    
+    logger.info("📥 닉네임 중복 확인 요청: %s", nickname)
+
     try:
-        result = await user_service.check_nickname(nickname)
-        logger.info(f"✅ 닉네임 확인 완료", extra={"data": result})
+        result = user_service.check_nickname(nickname)
+        logger.info("✅ 닉네임 확인 완료", extra={"data": result})
         return result
     except Exception as e:
-        logger.error(f"❌ 닉네임 확인 실패", extra={"data": {"error": str(e)}})
+        logger.error("❌ 닉네임 확인 실패", extra={"data": {"error": str(e)}})
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.post("/api/auth/nickname", response_model=NicknameLoginResponse)
-async def login_with_nickname(request: NicknameLoginRequest):
+def login_with_nickname(request: NicknameLoginRequest):
     """
     닉네임으로 로그인 또는 등록
-    
+
+    동기 Supabase 호출만 수행하므로 def 라우트로 선언해
+    FastAPI가 스레드풀에서 실행하도록 함 (이벤트 루프 비블로킹)
+
     Args:
         request: 닉네임 정보
-    
+
     Returns:
         사용자 정보와 신규 여부
     """
-    logger.info(f"📥 닉네임 로그인/등록 요청", extra={"data": {"nickname": request.nickname}})
-    
+    logger.info("📥 닉네임 로그인/등록 요청", extra={"data": {"nickname": request.nickname}})
+
     try:
-        result = await user_service.login_or_register(request.nickname)
-        logger.info(f"✅ 로그인/등록 성공", extra={"data": {
+        result = user_service.login_or_register(request.nickname)
+        logger.info("✅ 로그인/등록 성공", extra={"data": {
             "id": result["id"],
             "nickname": result["nickname"],
             "isNew": result["isNew"]
         }})
         return NicknameLoginResponse(**result)
     except Exception as e:
-        logger.error(f"❌ 로그인/등록 실패", extra={"data": {"error": str(e)}})
+        logger.error("❌ 로그인/등록 실패", extra={"data": {"error": str(e)}})
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -506,22 +1020,30 @@ async def get_report_detail(report_id: str):
     Returns:
         보고서 상세 정보와 에이전트별 결과
     """
-    logger.info(f"📥 보고서 상세 조회 요청", extra={"data": {"report_id": report_id}})
+    logger.info("📥 보고서 상세 조회 요청", extra={"data": {"report_id": report_id}})
 
     try:
         if db_service:
-            # 데이터베이스에서 보고서와 에이전트 결과 조회
-            report = await db_service.get_report_with_agents(report_id=report_id)
+            # 보고서는 저장 후 불변이므로 TTL 캐시로 반복 조회 시 DB 왕복 생략
+            video_cache = get_video_cache()
+            report = video_cache.get(f"report:{report_id}")
+            if report is None:
+                # 데이터베이스에서 보고서와 에이전트 결과 조회
+                report = await db_service.get_report_with_agents(report_id=report_id)
+                if report:
+                    video_cache.set(f"report:{report_id}", report, ttl=3600)
+            else:
+                logger.info("💾 캐시된 보고서 사용", extra={"data": {"report_id": report_id}})
 
             if report:
-                logger.info(f"✅ 보고서 상세 조회 완료", extra={"data": {
+                logger.info("✅ 보고서 상세 조회 완료", extra={"data": {
                     "report_id": report_id,
                     "video_id": report.get("video_id"),
                     "agent_count": len(report.get("agent_results", {}))
                 }})
                 return report
             else:
-                logger.warning(f"⚠️ 보고서 없음: {report_id}")
+                logger.warning("⚠️ 보고서 없음: %s", report_id)
                 raise HTTPException(status_code=404, detail="보고서를 찾을 수 없습니다")
         else:
             logger.warning("⚠️ 데이터베이스 서비스 사용 불가")
@@ -529,7 +1051,7 @@ async def get_report_detail(report_id: str):
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"❌ 보고서 상세 조회 실패", extra={"data": {"error": str(e)}})
+        logger.error("❌ 보고서 상세 조회 실패", extra={"data": {"error": str(e)}})
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -544,14 +1066,14 @@ async def get_user_reports(user_id: str):
     Returns:
         사용자의 분석 보고서 목록
     """
-    logger.info(f"📥 사용자 보고서 목록 조회 요청", extra={"data": {"user_id": user_id}})
+    logger.info("📥 사용자 보고서 목록 조회 요청", extra={"data": {"user_id": user_id}})
 
     try:
         if db_service:
             # 데이터베이스에서 사용자별 보고서 조회
             reports = await db_service.get_user_reports(user_id=user_id, limit=20)
 
-            logger.info(f"✅ 보고서 목록 조회 완료", extra={"data": {
+            logger.info("✅ 보고서 목록 조회 완료", extra={"data": {
                 "user_id": user_id,
                 "count": len(reports)
             }})
@@ -561,10 +1083,102 @@ async def get_user_reports(user_id: str):
             logger.warning("⚠️ 데이터베이스 서비스 사용 불가")
             return {"reports": []}
     except Exception as e:
-        logger.error(f"❌ 보고서 목록 조회 실패", extra={"data": {"error": str(e)}})
+        logger.error("❌ 보고서 목록 조회 실패", extra={"data": {"error": str(e)}})
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.get("/api/reports/user/{user_id}/stream")
+async def stream_user_reports(user_id: str):
+    """
+    사용자별 분석 보고서 목록을 NDJSON으로 스트리밍
+
+    보고서 전체 배열을 한 번에 직렬화하지 않고 행 단위로 내려보내
+    클라이언트가 첫 행부터 증분 파싱할 수 있도록 함 (무한 스크롤 등)
+
+    Args:
+        user_id: 사용자 ID
+
+    Returns:
+        보고서별 한 줄 JSON 스트림 (application/x-ndjson)
+    """
+    logger.info("📥 사용자 보고서 스트리밍 요청", extra={"data": {"user_id": user_id}})
+
+    async def _iter_reports():
+        if not db_service:
+            logger.warning("⚠️ 데이터베이스 서비스 사용 불가")
+            return
+
+        reports = await db_service.get_user_reports(user_id=user_id, limit=20)
+        for report in reports:
+            yield orjson.dumps(report) + b"\n"
+
+        logger.info("✅ 보고서 스트리밍 완료", extra={"data": {
+            "user_id": user_id,
+            "count": len(reports)
+        }})
+
+    return StreamingResponse(_iter_reports(), media_type="application/x-ndjson")
+
+
+def _first_content_line(final_report: str) -> str:
+    """보고서에서 제목/빈 줄을 제외한 첫 내용 줄 추출 (최대 200자)
+
+    전체 보고서를 줄 리스트로 쪼개지 않도록 인덱스 스캔으로 줄 단위 순회
+    """
+    start = 0
+    length = len(final_report)
+    while start < length:
+        end = final_report.find("\n", start)
+        if end == -1:
+            end = length
+        line = final_report[start:end]
+        if line.strip() and not line.startswith("#"):
+            return line.strip()[:200]
+        start = end + 1
+    return ""
+
+
+def _report_to_summary(report: dict) -> dict:
+    """
+    DB 보고서 레코드를 프론트엔드 호환 요약 항목으로 변환 (순수 함수)
+
+    Args:
+        report: analysis_reports 테이블 레코드
+
+    Returns:
+        프론트엔드 요약 목록 항목 딕셔너리
+    """
+    # final_report에서 한 줄 요약 추출 (제목 줄 제외 첫 문장)
+    final_report = report.get("final_report", "")
+    one_line_summary = _first_content_line(final_report) if final_report else ""
+
+    video_id = report.get("video_id")
+    report_id = report.get("id")
+    created_at = report.get("created_at")
+    channel = report.get("channel", "")
+
+    return {
+        "video_id": video_id,
+        "url": f"https://youtube.com/watch?v={video_id}",
+        "title": report.get("title"),
+        "channel": channel,  # channel_title -> channel
+        "channel_title": channel,  # 호환성 유지
+        "duration": report.get("duration", ""),
+        "thumbnail_url": f"https://i.ytimg.com/vi/{video_id}/maxresdefault.jpg",
+        "published_at": created_at,
+        "view_count": 0,  # 백엔드에서 제공하지 않음
+        "summary": final_report,  # 전체 보고서
+        "one_line": one_line_summary,  # 한 줄 요약
+        "one_line_summary": one_line_summary,  # 호환성
+        "key_points": [],  # 빈 배열로 초기화
+        "detailed_summary": final_report,  # 상세 요약
+        "created_at": created_at,
+        "multi_agent": True,  # 멀티에이전트 결과임을 표시
+        "report_id": report_id,  # 보고서 ID 추가
+        "id": report_id  # id 필드 추가
+    }
+
+
 @app.get("/api/summaries")
 async def get_summaries(user_id: Optional[str] = None):
     """
@@ -576,7 +1190,7 @@ async def get_summaries(user_id: Optional[str] = None):
     Returns:
         사용자의 요약 목록 (배열 형태로 반환)
     """
-    logger.info(f"📥 요약 목록 조회 요청", extra={"data": {"user_id": user_id}})
+    logger.info("📥 요약 목록 조회 요청", extra={"data": {"user_id": user_id}})
 
     try:
         if not user_id:
@@ -589,42 +1203,9 @@ async def get_summaries(user_id: Optional[str] = None):
             reports = await db_service.get_user_reports(user_id=user_id, limit=20)
 
             # 프론트엔드 호환 형식으로 변환
-            summaries = []
-            for report in reports:
-                # final_report에서 한 줄 요약 추출 시도
-                final_report = report.get("final_report", "")
-                one_line_summary = ""
-                if final_report:
-                    # 첫 번째 문장이나 첫 줄을 한 줄 요약으로 사용
-                    lines = final_report.split('\n')
-                    for line in lines:
-                        if line.strip() and not line.startswith('#'):
-                            one_line_summary = line.strip()[:200]  # 최대 200자
-                            break
-
-                summary = {
-                    "video_id": report.get("video_id"),
-                    "url": f"https://youtube.com/watch?v={report.get('video_id')}",
-                    "title": report.get("title"),
-                    "channel": report.get("channel", ""),  # channel_title -> channel
-                    "channel_title": report.get("channel", ""),  # 호환성 유지
-                    "duration": report.get("duration", ""),
-                    "thumbnail_url": f"https://i.ytimg.com/vi/{report.get('video_id')}/maxresdefault.jpg",
-                    "published_at": report.get("created_at"),
-                    "view_count": 0,  # 백엔드에서 제공하지 않음
-                    "summary": final_report,  # 전체 보고서
-                    "one_line": one_line_summary,  # 한 줄 요약
-                    "one_line_summary": one_line_summary,  # 호환성
-                    "key_points": [],  # 빈 배열로 초기화
-                    "detailed_summary": final_report,  # 상세 요약
-                    "created_at": report.get("created_at"),
-                    "multi_agent": True,  # 멀티에이전트 결과임을 표시
-                    "report_id": report.get("id"),  # 보고서 ID 추가
-                    "id": report.get("id")  # id 필드 추가
-                }
-                summaries.append(summary)
-
-            logger.info(f"✅ 요약 목록 조회 완료", extra={"data": {
+            summaries = [_report_to_summary(report) for report in reports]
+
+            logger.info("✅ 요약 목록 조회 완료", extra={"data": {
                 "user_id": user_id,
                 "count": len(summaries)
             }})
@@ -634,24 +1215,15 @@ async def get_summaries(user_id: Optional[str] = None):
             logger.warning("⚠️ 데이터베이스 서비스 사용 불가")
             return []
     except Exception as e:
-        logger.error(f"❌ 요약 목록 조회 실패", extra={"data": {"error": str(e)}})
+        logger.error("❌ 요약 목록 조회 실패", extra={"data": {"error": str(e)}})
         return []  # 에러 시에도 빈 배열 반환
 
 
-@app.get("/health")
-async def health_check():
-    """서버 상태 확인 엔드포인트"""
-    logger.debug("🏥 헬스 체크 호출")
-    return {"status": "healthy", "service": "youtube-summarizer"}
-
-
 @app.get("/api/cookies/status")
 async def cookie_status():
     """쿠키 상태 확인 엔드포인트"""
-    from app.services.cookie_refresher import get_cookie_refresher
-
-    cookie_refresher = get_cookie_refresher()
-    status = cookie_refresher.get_status()
+    # 쿠키 파일 조회는 동기 I/O이므로 이벤트 루프를 막지 않게 스레드풀에서 실행
+    status = await asyncio.to_thread(cookie_refresher.get_status)
 
     logger.info("🍪 쿠키 상태 조회", extra={"data": status})
     return status
@@ -660,10 +1232,8 @@ async def cookie_status():
 @app.post("/api/cookies/refresh")
 async def refresh_cookies():
     """수동 쿠키 갱신 엔드포인트"""
-    from app.services.cookie_refresher import get_cookie_refresher
-
-    cookie_refresher = get_cookie_refresher()
-    success = cookie_refresher.refresh_cookies()
+    # Chrome 프로필 I/O와 yt-dlp 실행이 포함된 블로킹 호출 - 스레드풀로 오프로드
+    success = await asyncio.to_thread(cookie_refresher.refresh_cookies)
 
     if success:
         logger.info("✅ 쿠키 수동 갱신 성공")
@@ -673,6 +1243,21 @@ async def refresh_cookies():
         raise HTTPException(status_code=500, detail="쿠키 갱신 실패")
 
 
+# 테스트 조회용 프로젝션 - 불필요한 컬럼 전송을 막고 닉네임은 임베디드 리소스
+# 리네이밍(user_nickname:nicknames)으로 SQL 쪽에서 원하는 형태로 수신
+_TEST_REPORT_COLUMNS = (
+    "id, user_id, video_id, title, channel, duration, language, "
+    "created_at, final_report, user_nickname:nicknames!left(nickname)"
+)
+
+
+def _flatten_nickname(report: dict) -> dict:
+    """임베디드 user_nickname 딕셔너리를 닉네임 문자열로 평탄화"""
+    nickname = report.get("user_nickname")
+    report["user_nickname"] = nickname.get("nickname") if nickname else None
+    return report
+
+
 # 테스트용 조회 API
 @app.get("/api/test/reports")
 async def get_all_reports():
@@ -685,26 +1270,21 @@ async def get_all_reports():
         logger.info("📊 전체 보고서 조회 시작")
 
         # 보고서와 닉네임 정보를 조인하여 조회
+        # (필요한 컬럼만 명시하고 닉네임은 PostgREST 임베디드 리네이밍으로 수신)
         response = db_service.client.table("analysis_reports")\
-            .select("*, nicknames!left(id, nickname)")\
+            .select(_TEST_REPORT_COLUMNS)\
             .order("created_at", desc=True)\
             .limit(10)\
             .execute()
 
         if response.data:
-            logger.info(f"✅ {len(response.data)}개 보고서 조회 성공")
-            for report in response.data:
-                # nicknames 정보 처리
-                if report.get('nicknames'):
-                    report['user_nickname'] = report['nicknames'].get('nickname')
-                    del report['nicknames']
-                else:
-                    report['user_nickname'] = None
+            logger.info("✅ %d개 보고서 조회 성공", len(response.data))
+            reports = [_flatten_nickname(report) for report in response.data]
 
             return {
                 "status": "success",
-                "count": len(response.data),
-                "reports": response.data
+                "count": len(reports),
+                "reports": reports
             }
         else:
             logger.info("ℹ️ 저장된 보고서 없음")
@@ -715,7 +1295,7 @@ async def get_all_reports():
             }
 
     except Exception as e:
-        logger.error(f"❌ 보고서 조회 실패: {str(e)}")
+        logger.error("❌ 보고서 조회 실패: %s", e)
         raise HTTPException(status_code=500, detail=f"보고서 조회 실패: {str(e)}")
 
 
@@ -727,31 +1307,25 @@ async def get_report_by_video(video_id: str):
     - user_id와 nickname 정보도 함께 반환합니다
     """
     try:
-        logger.info(f"📊 비디오별 보고서 조회: {video_id}")
+        logger.info("📊 비디오별 보고서 조회: %s", video_id)
 
         response = db_service.client.table("analysis_reports")\
-            .select("*, nicknames!left(id, nickname)")\
+            .select(_TEST_REPORT_COLUMNS)\
             .eq("video_id", video_id)\
             .execute()
 
         if response.data:
-            logger.info(f"✅ {len(response.data)}개 보고서 발견")
-            for report in response.data:
-                # nicknames 정보 처리
-                if report.get('nicknames'):
-                    report['user_nickname'] = report['nicknames'].get('nickname')
-                    del report['nicknames']
-                else:
-                    report['user_nickname'] = None
+            logger.info("✅ %d개 보고서 발견", len(response.data))
+            reports = [_flatten_nickname(report) for report in response.data]
 
             return {
                 "status": "success",
                 "video_id": video_id,
-                "count": len(response.data),
-                "reports": response.data
+                "count": len(reports),
+                "reports": reports
             }
         else:
-            logger.info(f"ℹ️ {video_id}에 대한 보고서 없음")
+            logger.info("ℹ️ %s에 대한 보고서 없음", video_id)
             return {
                 "status": "success",
                 "video_id": video_id,
@@ -760,7 +1334,7 @@ async def get_report_by_video(video_id: str):
             }
 
     except Exception as e:
-        logger.error(f"❌ 보고서 조회 실패: {str(e)}")
+        logger.error("❌ 보고서 조회 실패: %s", e)
         raise HTTPException(status_code=500, detail=f"보고서 조회 실패: {str(e)}")
 
 
@@ -776,7 +1350,7 @@ async def test_save_report(
     - 닉네임을 UUID로 변환하여 저장하는 기능을 테스트합니다
     """
     try:
-        logger.info(f"🧪 테스트 보고서 저장 시작: {user_id}")
+        logger.info("🧪 테스트 보고서 저장 시작: %s", user_id)
 
         # 더미 에이전트 결과
         agent_results = {
@@ -803,19 +1377,17 @@ async def test_save_report(
         )
 
         if report_id:
-            logger.info(f"✅ 테스트 보고서 저장 성공: {report_id}")
+            logger.info("✅ 테스트 보고서 저장 성공: %s", report_id)
 
             # 저장된 보고서 조회
             saved_report = db_service.client.table("analysis_reports")\
-                .select("*, nicknames!left(id, nickname)")\
+                .select(_TEST_REPORT_COLUMNS)\
                 .eq("id", report_id)\
                 .single()\
                 .execute()
 
             if saved_report.data:
-                if saved_report.data.get('nicknames'):
-                    saved_report.data['user_nickname'] = saved_report.data['nicknames'].get('nickname')
-                    del saved_report.data['nicknames']
+                _flatten_nickname(saved_report.data)
 
             return {
                 "status": "success",
@@ -827,7 +1399,7 @@ async def test_save_report(
             raise HTTPException(status_code=500, detail="보고서 저장 실패")
 
     except Exception as e:
-        logger.error(f"❌ 테스트 보고서 저장 실패: {str(e)}")
+        logger.error("❌ 테스트 보고서 저장 실패: %s", e)
         raise HTTPException(status_code=500, detail=f"테스트 실패: {str(e)}")
 
 
@@ -6,12 +6,15 @@ from pydantic import BaseModel, Field
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 
+from app.models.agent_models import MultiAgentResult
+
 
 class SummarizeRequest(BaseModel):
     """요약 요청 모델"""
     url: str = Field(..., description="유튜브 영상 URL", example="https://youtube.com/watch?v=dQw4w9WgXcQ")
     user_id: Optional[str] = Field(None, description="사용자 ID (옵션)")
     fcm_token: Optional[str] = Field(None, description="FCM 푸시 알림 토큰 (옵션)")
+    force_refresh: bool = Field(default=False, description="캐시된 분석 결과를 무시하고 재분석 수행 여부")
 
 
 class Summary(BaseModel):
@@ -80,7 +83,8 @@ class MultiAgentAnalyzeResponse(BaseModel):
     language: Optional[str] = Field(None, description="자막 언어 코드")
     
     # 멀티에이전트 분석 결과
-    analysis_result: Dict[str, Any] = Field(..., description="멀티에이전트 분석 결과")
+    # (dict로 미리 덤프하지 않고 Pydantic 모델을 그대로 담아 직렬화 시점에 한 번만 변환)
+    analysis_result: MultiAgentResult = Field(..., description="멀티에이전트 분석 결과")
     
     # 최종 보고서 (편의성을 위해 최상위에도 포함)
     final_report: Optional[str] = Field(None, description="최종 종합 분석 보고서")
@@ -89,8 +93,10 @@ class MultiAgentAnalyzeResponse(BaseModel):
     transcript_available: bool = Field(..., description="자막 사용 가능 여부")
     analysis_type: str = Field(default="multi_agent", description="분석 유형")
     processing_time: Optional[float] = Field(None, description="처리 시간 (초)")
-    
+
     class Config:
+        # 응답 모델은 생성 후 변경되지 않으므로 불변으로 고정 (가변성 관리 비용 제거)
+        frozen = True
         json_schema_extra = {
             "example": {
                 "video_id": "dQw4w9WgXcQ",
@@ -25,7 +25,19 @@ class DatabaseService(LoggerMixin):
         
         self.client: Client = create_client(supabase_url, supabase_key)
         self.log_info("🗄️ Supabase 데이터베이스 서비스 초기화 완료")
-    
+
+    def warm_up(self) -> None:
+        """
+        커넥션 풀 예열
+        첫 사용자 요청이 DNS 조회 + TCP/TLS 핸드셰이크 비용을 내지 않도록
+        기동 시 가벼운 쿼리로 keep-alive 커넥션을 미리 열어둠
+        """
+        try:
+            self.client.table("analysis_reports").select("id").limit(1).execute()
+            self.log_info("🔥 Supabase 커넥션 예열 완료")
+        except Exception as e:
+            self.log_warning(f"⚠️ Supabase 커넥션 예열 실패 (무시): {e}")
+
     async def get_video(self, video_id: str) -> Optional[Dict[str, Any]]:
         """
         비디오 정보를 데이터베이스에서 조회
@@ -603,4 +615,47 @@ class DatabaseService(LoggerMixin):
                 "report_id": report_id,
                 "error": str(e)
             })
+            return None
+
+    async def get_latest_report_by_video(
+        self,
+        video_id: str,
+        language: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        비디오 ID로 가장 최근 분석 보고서 조회 (재분석 생략용 캐시 조회)
+
+        Args:
+            video_id: YouTube 비디오 ID
+            language: 자막 언어 (지정 시 동일 언어 보고서만 조회)
+
+        Returns:
+            가장 최근 보고서 레코드 또는 None
+        """
+        try:
+            self.log_debug(f"🔍 비디오 보고서 캐시 조회", data={
+                "video_id": video_id,
+                "language": language
+            })
+
+            query = self.client.table("analysis_reports")\
+                .select("*")\
+                .eq("video_id", video_id)
+
+            if language:
+                query = query.eq("language", language)
+
+            response = query.order("created_at", desc=True)\
+                .limit(1)\
+                .execute()
+
+            if response.data:
+                return response.data[0]
+            return None
+
+        except Exception as e:
+            self.log_error(f"❌ 비디오 보고서 캐시 조회 실패", data={
+                "video_id": video_id,
+                "error": str(e)
+            })
             return None
\ No newline at end of file
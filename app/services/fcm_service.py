@@ -2,6 +2,7 @@
 FCM (Firebase Cloud Messaging) 서비스
 푸시 알림 전송을 위한 서비스
 """
+import asyncio
 import os
 from typing import Optional, Dict, Any
 import firebase_admin
@@ -122,7 +123,9 @@ class FCMService(LoggerMixin):
                 "title": title
             })
 
-            response = messaging.send(message)
+            # messaging.send는 블로킹 HTTP 호출이므로 이벤트 루프를 막지 않게
+            # 스레드풀에서 실행 (세션은 Admin SDK가 앱 단위로 재사용)
+            response = await asyncio.to_thread(messaging.send, message)
 
             self.log_info("✅ FCM 알림 전송 성공", data={
                 "response": response,
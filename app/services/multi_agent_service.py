@@ -80,24 +80,57 @@ class MultiAgentService(LoggerMixin):
         return self._agents[agent_name]
     
     async def process_full_analysis(
-        self, 
+        self,
         transcript: str,
         title: str,
         video_id: str,
         language: Optional[str] = None
     ) -> MultiAgentResult:
         """
-        전체 멀티에이전트 분석 파이프라인 실행
-        
+        전체 멀티에이전트 분석 파이프라인 실행 (단일 응답)
+
+        내부적으로 stream_full_analysis 제너레이터를 끝까지 소비해
+        최종 결과만 반환 (기존 /api/summarize 경로용)
+
         Args:
             transcript: 원본 자막 텍스트
             title: 영상 제목
             video_id: 비디오 ID
             language: 자막 언어
-            
+
         Returns:
             전체 분석 결과
         """
+        result = None
+        async for agent_name, partial in self.stream_full_analysis(
+            transcript, title, video_id, language
+        ):
+            if agent_name == "result":
+                result = partial
+        return result
+
+    async def stream_full_analysis(
+        self,
+        transcript: str,
+        title: str,
+        video_id: str,
+        language: Optional[str] = None
+    ):
+        """
+        전체 멀티에이전트 분석 파이프라인 실행 (스트리밍)
+
+        각 에이전트가 완료될 때마다 (에이전트명, 부분 결과) 튜플을 yield하고,
+        마지막에 ("result", MultiAgentResult)를 yield (SSE 엔드포인트용)
+
+        Args:
+            transcript: 원본 자막 텍스트
+            title: 영상 제목
+            video_id: 비디오 ID
+            language: 자막 언어
+
+        Yields:
+            (에이전트명, 부분 결과) 튜플 — 마지막 항목은 ("result", 전체 결과)
+        """
         start_time = datetime.now()
         
         # 초기 상태 설정
@@ -118,6 +151,14 @@ class MultiAgentService(LoggerMixin):
         })
         
         try:
+            # 파이프라인은 각 단계가 직전 단계의 출력을 소비하는 직렬 의존 체인이라
+            # asyncio.gather로 병렬화할 수 없음. 대신 에이전트 모듈 임포트/정규식
+            # 컴파일 비용(첫 요청 시)을 단계 사이에 끼어들지 않도록 미리 워커
+            # 스레드에서 일괄 선로딩
+            await asyncio.to_thread(
+                lambda: [self._get_agent(name) for name in self.agent_pipeline]
+            )
+
             # 1단계: 자막 정제
             await self._update_status(result, "transcript_refiner")
             transcript_input = TranscriptRefinementInput(transcript=transcript)
@@ -126,7 +167,8 @@ class MultiAgentService(LoggerMixin):
             transcript_result = await transcript_agent.process(transcript_input.model_dump())
             result.transcript_refinement = transcript_result
             await self._mark_completed(result, "transcript_refiner")
-            
+            yield ("transcript_refiner", transcript_result)
+
             # 2단계: 화자 구분
             await self._update_status(result, "speaker_diarizer")
             speaker_input = SpeakerDiarizationInput(
@@ -137,7 +179,8 @@ class MultiAgentService(LoggerMixin):
             speaker_result = await speaker_agent.process(speaker_input.model_dump())
             result.speaker_diarization = speaker_result
             await self._mark_completed(result, "speaker_diarizer")
-            
+            yield ("speaker_diarizer", speaker_result)
+
             # 3단계: 주제 응집
             await self._update_status(result, "topic_cohesion")
             topic_input = TopicCohesionInput(
@@ -148,7 +191,8 @@ class MultiAgentService(LoggerMixin):
             topic_result = await topic_agent.process(topic_input.model_dump())
             result.topic_cohesion = topic_result
             await self._mark_completed(result, "topic_cohesion")
-            
+            yield ("topic_cohesion", topic_result)
+
             # 4단계: 구조 설계
             await self._update_status(result, "structure_designer")
             structure_input = StructureDesignInput(
@@ -159,7 +203,8 @@ class MultiAgentService(LoggerMixin):
             structure_result = await structure_agent.process(structure_input.model_dump())
             result.structure_design = structure_result
             await self._mark_completed(result, "structure_designer")
-            
+            yield ("structure_designer", structure_result)
+
             # 5단계: 보고서 종합
             await self._update_status(result, "report_synthesizer")
             synthesis_input = ReportSynthesisInput(
@@ -172,7 +217,8 @@ class MultiAgentService(LoggerMixin):
             synthesis_result = await synthesis_agent.process(synthesis_input.model_dump())
             result.report_synthesis = synthesis_result
             await self._mark_completed(result, "report_synthesizer")
-            
+            yield ("report_synthesizer", synthesis_result)
+
             # 완료 처리
             end_time = datetime.now()
             processing_time = (end_time - start_time).total_seconds()
@@ -189,9 +235,7 @@ class MultiAgentService(LoggerMixin):
                 "successful_agents": result.successful_agents,
                 "completed_agents": result.processing_status.completed_agents
             })
-            
-            return result
-            
+
         except Exception as e:
             # 실패 처리
             end_time = datetime.now()
@@ -210,10 +254,10 @@ class MultiAgentService(LoggerMixin):
                 "completed_agents": result.processing_status.completed_agents,
                 "elapsed_time": f"{processing_time:.2f}초"
             })
-            
-            # 부분 성공도 유효한 결과로 반환 (디버깅 및 개선 목적)
-            return result
-    
+
+        # 부분 성공도 유효한 결과로 반환 (디버깅 및 개선 목적)
+        yield ("result", result)
+
     async def _update_status(self, result: MultiAgentResult, current_agent: str) -> None:
         """
         처리 상태 업데이트
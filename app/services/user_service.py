@@ -57,7 +57,7 @@ class UserService:
             except:
                 logger.warning("⚠️ 테이블 자동 생성 실패 - 수동 생성 필요")
     
-    async def check_nickname(self, nickname: str) -> Dict[str, Any]:
+    def check_nickname(self, nickname: str) -> Dict[str, Any]:
         """
         닉네임 중복 확인 (대소문자 무시)
         
@@ -102,7 +102,7 @@ class UserService:
             logger.error(f"❌ 닉네임 확인 중 오류", extra={"data": {"error": str(e)}})
             raise
     
-    async def login_or_register(self, nickname: str) -> Dict[str, Any]:
+    def login_or_register(self, nickname: str) -> Dict[str, Any]:
         """
         닉네임으로 로그인 또는 등록
         
@@ -192,7 +192,7 @@ class UserService:
             logger.error(f"❌ 로그인/등록 중 오류", extra={"data": {"error": str(e)}})
             raise
     
-    async def get_user_by_id(self, user_id: str) -> Optional[Dict[str, Any]]:
+    def get_user_by_id(self, user_id: str) -> Optional[Dict[str, Any]]:
         """
         사용자 ID로 정보 조회
         
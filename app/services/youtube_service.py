@@ -9,6 +9,11 @@ import requests
 from app.models.summary import VideoData
 from app.utils.logger import LoggerMixin, setup_logger
 
+# 비디오 ID 추출 패턴은 임포트 시점에 한 번만 컴파일 (요청마다 재구성 방지)
+_VIDEO_ID_RE = re.compile(
+    r'(?:youtube\.com\/watch\?v=|youtu\.be\/|youtube\.com\/embed\/|youtube\.com\/shorts\/)([^&\n?#]+)'
+)
+
 
 class YouTubeService(LoggerMixin):
     """유튜브 관련 기능을 처리하는 서비스 클래스"""
@@ -32,20 +37,14 @@ class YouTubeService(LoggerMixin):
             ValueError: 유효하지 않은 URL
         """
         self.log_debug(f"📎 URL에서 비디오 ID 추출 시작", data={"url": url})
-        
-        # 다양한 유튜브 URL 형식 지원
-        patterns = [
-            r'(?:youtube\.com\/watch\?v=|youtu\.be\/|youtube\.com\/embed\/)([^&\n?#]+)',
-            r'(?:youtube\.com\/shorts\/)([^&\n?#]+)',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, url)
-            if match:
-                video_id = match.group(1)
-                self.log_info(f"✅ 비디오 ID 추출 성공: {video_id}")
-                return video_id
-        
+
+        # 다양한 유튜브 URL 형식 지원 (사전 컴파일된 통합 패턴 단일 검색)
+        match = _VIDEO_ID_RE.search(url)
+        if match:
+            video_id = match.group(1)
+            self.log_info(f"✅ 비디오 ID 추출 성공: {video_id}")
+            return video_id
+
         self.log_error(f"❌ 유효하지 않은 URL", data={"url": url})
         raise ValueError("유효한 유튜브 URL이 아닙니다.")
     
@@ -0,0 +1,158 @@
+"""
+LLM 응답 캐시 모듈
+동일한 프롬프트로 반복되는 LLM 호출을 캐시하여 지연시간과 비용 절감
+"""
+import os
+import time
+import json
+import hashlib
+from collections import OrderedDict
+from typing import Optional, Dict, Any
+from app.utils.logger import LoggerMixin
+
+# Redis 백엔드는 옵셔널 - 없으면 인메모리 캐시만 사용
+try:
+    import redis.asyncio as aioredis
+except ImportError:
+    aioredis = None
+
+
+class LLMCache(LoggerMixin):
+    """
+    LLM 응답 캐시
+
+    동작 방식:
+    - 키: sha256(모델 + 전체 프롬프트 + 호출 파라미터)
+    - REDIS_URL 환경변수가 있으면 Redis 백엔드 사용 (프로세스 간 공유)
+    - 없으면 인프로세스 TTL LRU 캐시로 폴백
+    - 동일 영상 재요청, 재시도, 개발 중 반복 호출 시 API 호출 자체를 생략
+    """
+
+    def __init__(self, max_entries: Optional[int] = None, default_ttl: Optional[int] = None):
+        """
+        캐시 초기화
+
+        Args:
+            max_entries: 인메모리 캐시 최대 항목 수 (LRU 방출,
+                기본값은 LLM_CACHE_MAX_ENTRIES 환경변수 또는 256)
+            default_ttl: 기본 TTL (초, 기본값은 LLM_CACHE_TTL 환경변수
+                또는 24시간)
+        """
+        self.max_entries = max_entries or int(os.getenv("LLM_CACHE_MAX_ENTRIES", "256"))
+        self.default_ttl = default_ttl or int(os.getenv("LLM_CACHE_TTL", "86400"))
+
+        # 인메모리 LRU: key -> (expires_at, value)
+        self._memory: "OrderedDict[str, tuple]" = OrderedDict()
+
+        # Redis 백엔드 (옵셔널)
+        self._redis = None
+        redis_url = os.getenv("REDIS_URL")
+        if redis_url and aioredis is not None:
+            try:
+                self._redis = aioredis.from_url(redis_url, decode_responses=True)
+                self.log_info("🧠 LLM 캐시 Redis 백엔드 연결", data={"url": redis_url})
+            except Exception as e:
+                self.log_warning(f"⚠️ Redis 연결 실패, 인메모리 캐시 사용: {e}")
+                self._redis = None
+
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(model: str, prompt: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """
+        캐시 키 생성 (모델 + 프롬프트 + 파라미터 해시)
+
+        Args:
+            model: 모델명
+            prompt: 전체 프롬프트
+            params: 호출 파라미터 (reasoning/verbosity 등)
+
+        Returns:
+            sha256 해시 문자열
+        """
+        payload = json.dumps(
+            {"m": model, "p": prompt, "o": params or {}},
+            sort_keys=True,
+            ensure_ascii=False
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    async def get(self, key: str) -> Optional[str]:
+        """
+        캐시 조회
+
+        Args:
+            key: 캐시 키
+
+        Returns:
+            캐시된 응답 텍스트 또는 None
+        """
+        # 1. Redis 우선 조회
+        if self._redis is not None:
+            try:
+                value = await self._redis.get(f"llm:{key}")
+                if value is not None:
+                    self.hits += 1
+                    return value
+            except Exception as e:
+                self.log_warning(f"⚠️ Redis 조회 실패, 인메모리 캐시 사용: {e}")
+
+        # 2. 인메모리 조회
+        entry = self._memory.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at > time.time():
+                self._memory.move_to_end(key)  # LRU 갱신
+                self.hits += 1
+                return value
+            # 만료된 항목 제거
+            del self._memory[key]
+
+        self.misses += 1
+        return None
+
+    async def set(self, key: str, value: str, ttl: Optional[int] = None) -> None:
+        """
+        캐시 저장
+
+        Args:
+            key: 캐시 키
+            value: 응답 텍스트
+            ttl: TTL (초, 기본값 사용 시 None)
+        """
+        ttl = ttl or self.default_ttl
+
+        if self._redis is not None:
+            try:
+                await self._redis.set(f"llm:{key}", value, ex=ttl)
+            except Exception as e:
+                self.log_warning(f"⚠️ Redis 저장 실패, 인메모리 캐시만 사용: {e}")
+
+        self._memory[key] = (time.time() + ttl, value)
+        self._memory.move_to_end(key)
+
+        # LRU 방출
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """캐시 상태 반환 (로깅/모니터링용)"""
+        return {
+            "backend": "redis" if self._redis is not None else "memory",
+            "entries": len(self._memory),
+            "hits": self.hits,
+            "misses": self.misses
+        }
+
+
+# 싱글톤 인스턴스
+_llm_cache: Optional[LLMCache] = None
+
+
+def get_llm_cache() -> LLMCache:
+    """싱글톤 LLMCache 인스턴스 반환"""
+    global _llm_cache
+    if _llm_cache is None:
+        _llm_cache = LLMCache()
+    return _llm_cache
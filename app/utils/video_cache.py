@@ -0,0 +1,101 @@
+"""
+영상 데이터 캐시 모듈
+동일 영상 재요청 시 yt-dlp 메타데이터/자막 다운로드와 재분석을 생략
+"""
+import os
+import time
+from collections import OrderedDict
+from typing import Optional, Any, Dict
+from app.utils.logger import LoggerMixin
+
+
+class VideoCache(LoggerMixin):
+    """
+    비디오 ID 기반 인프로세스 캐시
+
+    동작 방식:
+    - 키: "video:{video_id}" (메타데이터+자막), "analysis:{video_id}:{언어}" (분석 결과),
+      "report:{report_id}" (저장된 보고서 상세)
+    - 파이썬 객체를 그대로 보관하는 TTL LRU 캐시 (직렬화 비용 없음)
+    - 같은 영상의 반복 요청 시 네트워크 왕복과 전체 에이전트 파이프라인을 생략
+    """
+
+    def __init__(self, max_entries: Optional[int] = None, default_ttl: Optional[int] = None):
+        """
+        캐시 초기화
+
+        Args:
+            max_entries: 캐시 최대 항목 수 (LRU 방출,
+                기본값은 VIDEO_CACHE_MAX_ENTRIES 환경변수 또는 128)
+            default_ttl: 기본 TTL (초, 기본값은 VIDEO_CACHE_TTL 환경변수
+                또는 7일)
+        """
+        self.max_entries = max_entries or int(os.getenv("VIDEO_CACHE_MAX_ENTRIES", "128"))
+        self.default_ttl = default_ttl or int(os.getenv("VIDEO_CACHE_TTL", "604800"))
+
+        # key -> (expires_at, value)
+        self._memory: "OrderedDict[str, tuple]" = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        캐시 조회
+
+        Args:
+            key: 캐시 키
+
+        Returns:
+            캐시된 객체 또는 None
+        """
+        entry = self._memory.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at > time.time():
+                self._memory.move_to_end(key)  # LRU 갱신
+                self.hits += 1
+                return value
+            # 만료된 항목 제거
+            del self._memory[key]
+
+        self.misses += 1
+        return None
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        """
+        캐시 저장
+
+        Args:
+            key: 캐시 키
+            value: 저장할 객체
+            ttl: TTL (초, 기본값 사용 시 None)
+        """
+        ttl = ttl or self.default_ttl
+
+        self._memory[key] = (time.time() + ttl, value)
+        self._memory.move_to_end(key)
+
+        # LRU 방출
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """캐시 상태 반환 (로깅/모니터링용)"""
+        return {
+            "entries": len(self._memory),
+            "hits": self.hits,
+            "misses": self.misses
+        }
+
+
+# 싱글톤 인스턴스
+_video_cache: Optional[VideoCache] = None
+
+
+def get_video_cache() -> VideoCache:
+    """싱글톤 VideoCache 인스턴스 반환"""
+    global _video_cache
+    if _video_cache is None:
+        _video_cache = VideoCache()
+    return _video_cache
@@ -5,6 +5,14 @@ import uvicorn
 import os
 from dotenv import load_dotenv
 
+# uvloop이 있는 환경(리눅스/맥)에서는 기본 이벤트 루프로 설치
+# (윈도우는 uvloop 미지원이므로 기본 루프 유지)
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    uvloop = None
+
 # 환경 변수 로드
 load_dotenv()
 